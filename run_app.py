@@ -1,16 +1,16 @@
 #!/usr/bin/env python3
 """Run the CV Check application."""
 
-import sys
-import os
-from pathlib import Path
+try:
+    # Installed with `pip install -e .`, the modules resolve without path hacks
+    from app import main
+except ImportError:
+    # Plain checkout, fall back to importing from the src directory
+    import sys
+    from pathlib import Path
 
-# Add src directory to Python path
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
-
-# Import using absolute imports after path modification
-import app
+    sys.path.insert(0, str(Path(__file__).parent / "src"))
+    from app import main
 
 if __name__ == "__main__":
-    app.main()
\ No newline at end of file
+    main()
@@ -1,12 +1,169 @@
 """Gap analysis module for identifying strengths and weaknesses."""
 
 import logging
-from typing import List, Dict, Any, Tuple
-from analyzer.resume_analyzer import ResumeData
-from analyzer.job_analyzer import JobRequirements
+from typing import List, Dict, Any, Sequence, Tuple
+from .resume_analyzer import ResumeData
+from .job_analyzer import JobRequirements
 
 logger = logging.getLogger(__name__)
 
+# Static point templates, copied per call so callers may mutate the results
+_STRONG_TEMPLATES: Dict[str, Dict[str, str]] = {
+    "skills": {
+        "category": "Skills",
+        "explanation": "Your technical expertise aligns well with the job requirements.",
+        "leverage": "Highlight these skills prominently in your resume and mention specific projects where you used them."
+    },
+    "phd": {
+        "category": "Education",
+        "point": "Advanced academic credentials (PhD)",
+        "explanation": "Your PhD demonstrates deep expertise and research capabilities.",
+        "leverage": "Emphasize problem-solving skills, analytical thinking, and ability to work independently."
+    },
+    "education": {
+        "category": "Education",
+        "explanation": "Your educational credentials meet or exceed the job requirements.",
+        "leverage": "Connect your academic learnings to practical business applications."
+    },
+    "experience": {
+        "category": "Experience",
+        "point": "Substantial professional experience",
+        "explanation": "You have relevant work experience that demonstrates practical skills.",
+        "leverage": "Quantify your achievements and focus on results you delivered."
+    },
+    "languages": {
+        "category": "Languages",
+        "explanation": "Your language skills meet the position requirements.",
+        "leverage": "Mention specific contexts where you used these languages professionally."
+    },
+    "location": {
+        "category": "Location",
+        "point": "Optimal location match",
+        "explanation": "Your location aligns perfectly with the job location.",
+        "leverage": "Emphasize your local market knowledge and availability for in-person collaboration."
+    },
+    "research": {
+        "category": "Research Skills",
+        "point": "Advanced research and analytical capabilities",
+        "explanation": "PhD training provides strong analytical and problem-solving skills.",
+        "leverage": "Emphasize your ability to tackle complex problems systematically."
+    },
+    "diverse_skills": {
+        "category": "Technical Diversity",
+        "point": "Diverse technical skill set",
+        "explanation": "You demonstrate adaptability across multiple technologies.",
+        "leverage": "Show how you can quickly learn and apply new technologies."
+    },
+    "multilingual": {
+        "category": "Communication",
+        "point": "Multilingual communication abilities",
+        "explanation": "Multiple language skills demonstrate cultural adaptability.",
+        "leverage": "Highlight your ability to work in international environments."
+    },
+}
+
+_WEAK_TEMPLATES: Dict[str, Dict[str, str]] = {
+    "skills": {
+        "category": "Skills",
+        "explanation": "Some required technical skills are not evident in your resume.",
+        "impact": "This may lead to automatic filtering by ATS systems."
+    },
+    "overqualification": {
+        "category": "Overqualification",
+        "point": "PhD for junior-level position",
+        "explanation": "Your advanced degree may be seen as overqualification for this role.",
+        "impact": "Employers might worry about retention, salary expectations, or cultural fit."
+    },
+    "industry_fit": {
+        "category": "Industry Fit",
+        "point": "Academic background for industry role",
+        "explanation": "Strong academic background may not align with industry expectations.",
+        "impact": "May be perceived as lacking practical business experience."
+    },
+    "experience": {
+        "category": "Experience",
+        "point": "Limited professional experience for senior role",
+        "explanation": "The position requires more extensive industry experience.",
+        "impact": "May not meet minimum experience requirements."
+    },
+    "languages": {
+        "category": "Languages",
+        "point": "Language requirements not clearly met",
+        "explanation": "Required language proficiency is not evident in your resume.",
+        "impact": "May be filtered out if language skills are mandatory."
+    },
+    "education": {
+        "category": "Education",
+        "point": "Educational requirements not met",
+        "explanation": "Your educational background doesn't match the specified requirements.",
+        "impact": "May not meet minimum qualification criteria."
+    },
+}
+
+_GENERIC_WEAK_POINTS: Tuple[Dict[str, str], ...] = (
+    {
+        "category": "Keyword Optimization",
+        "point": "Limited keyword alignment with job description",
+        "explanation": "Your resume may not contain enough keywords from the job posting.",
+        "impact": "ATS systems might not rank your resume highly."
+    },
+    {
+        "category": "Quantification",
+        "point": "Achievements could be more quantified",
+        "explanation": "Your accomplishments lack specific metrics and numbers.",
+        "impact": "Makes it harder for recruiters to assess your impact."
+    },
+    {
+        "category": "Industry Language",
+        "point": "Could use more industry-specific terminology",
+        "explanation": "Your resume might benefit from more business-focused language.",
+        "impact": "May not resonate as strongly with hiring managers."
+    },
+)
+
+_IMPROVEMENT_TEMPLATES: Dict[str, Dict[str, str]] = {
+    "skills": {
+        "category": "Skills Enhancement",
+        "action": "Include any projects, courses, or exposure to these technologies in your resume.",
+        "priority": "High",
+        "impact": "Improves ATS keyword matching and demonstrates technical relevance."
+    },
+    "phd": {
+        "category": "PhD Positioning",
+        "recommendation": "Reframe PhD as practical problem-solving experience",
+        "action": "Focus on transferable skills: analytical thinking, project management, communication.",
+        "priority": "High",
+        "impact": "Reduces overqualification concerns and emphasizes business value."
+    },
+    "industry": {
+        "category": "Industry Positioning",
+        "recommendation": "Emphasize business impact over academic achievements",
+        "action": "Quantify results, use business language, highlight practical applications.",
+        "priority": "High",
+        "impact": "Demonstrates industry readiness and practical value."
+    },
+    "experience": {
+        "category": "Experience Optimization",
+        "recommendation": "Quantify achievements with specific metrics",
+        "action": "Add numbers: budget managed, team size, performance improvements, etc.",
+        "priority": "Medium",
+        "impact": "Makes your contributions more tangible and impressive."
+    },
+    "keywords": {
+        "category": "Keyword Optimization",
+        "action": "Naturally integrate these terms throughout your resume content.",
+        "priority": "Medium",
+        "impact": "Improves ATS parsing and keyword density scores."
+    },
+}
+
+
+def _fmt_top(prefix: str, items: Sequence[str], limit: int = 3) -> str:
+    """Format a label followed by the first few items, comma separated."""
+    if not items:
+        return prefix.rstrip(": ")
+    return prefix + ", ".join(items[:limit])
+
 
 class GapAnalyzer:
     """Analyzer for identifying gaps between resume and job requirements."""
@@ -33,20 +190,24 @@ class GapAnalyzer:
             Tuple of (strong_points, weak_points, improvements)
         """
         try:
+            # Shared by the strong points, weak points and improvements below
+            matching_skills = self._find_matching_skills(resume_data, job_requirements)
+            missing_skills = self._find_missing_skills(resume_data, job_requirements)
+            
             strong_points = self._identify_strong_points(
-                resume_data, job_requirements, score_breakdown
+                resume_data, job_requirements, score_breakdown, matching_skills
             )
             weak_points = self._identify_weak_points(
-                resume_data, job_requirements, score_breakdown
+                resume_data, job_requirements, score_breakdown, missing_skills
             )
             improvements = self._generate_improvements(
-                resume_data, job_requirements, weak_points
+                resume_data, job_requirements, weak_points, missing_skills
             )
             
             return strong_points, weak_points, improvements
             
         except Exception as e:
-            logger.error(f"Error in gap analysis: {str(e)}")
+            logger.error("Error in gap analysis: %s", e)
             return [], [], []
 
     def _identify_strong_points(
@@ -54,71 +215,49 @@ class GapAnalyzer:
         resume_data: ResumeData,
         job_requirements: JobRequirements,
         score_breakdown: Dict[str, Any],
+        matching_skills: List[str],
     ) -> List[Dict[str, str]]:
         """Identify candidate's strong points."""
         strong_points = []
         
         # Skills match
         if score_breakdown.get("skills_match", 0) >= 70:
-            matching_skills = self._find_matching_skills(resume_data, job_requirements)
             if matching_skills:
                 strong_points.append({
-                    "category": "Skills",
-                    "point": f"Strong technical skills match: {', '.join(matching_skills[:3])}",
-                    "explanation": "Your technical expertise aligns well with the job requirements.",
-                    "leverage": "Highlight these skills prominently in your resume and mention specific projects where you used them."
+                    **_STRONG_TEMPLATES["skills"],
+                    "point": _fmt_top("Strong technical skills match: ", matching_skills),
                 })
         
         # Education match
         if score_breakdown.get("education_match", 0) >= 80:
             if resume_data.has_phd and job_requirements.job_level in ["senior", "mid"]:
-                strong_points.append({
-                    "category": "Education",
-                    "point": "Advanced academic credentials (PhD)",
-                    "explanation": "Your PhD demonstrates deep expertise and research capabilities.",
-                    "leverage": "Emphasize problem-solving skills, analytical thinking, and ability to work independently."
-                })
+                strong_points.append(dict(_STRONG_TEMPLATES["phd"]))
             elif resume_data.education:
                 degree_info = resume_data.education[0]
                 strong_points.append({
-                    "category": "Education",
+                    **_STRONG_TEMPLATES["education"],
                     "point": f"Relevant educational background: {degree_info.get('degree', '')}",
-                    "explanation": "Your educational credentials meet or exceed the job requirements.",
-                    "leverage": "Connect your academic learnings to practical business applications."
                 })
         
         # Experience relevance
         if score_breakdown.get("experience_match", 0) >= 70:
             if len(resume_data.experience) >= 3:
-                strong_points.append({
-                    "category": "Experience",
-                    "point": "Substantial professional experience",
-                    "explanation": "You have relevant work experience that demonstrates practical skills.",
-                    "leverage": "Quantify your achievements and focus on results you delivered."
-                })
+                strong_points.append(dict(_STRONG_TEMPLATES["experience"]))
         
         # Language skills
         if score_breakdown.get("language_match", 0) >= 80:
             strong_points.append({
-                "category": "Languages",
-                "point": f"Language proficiency: {', '.join(resume_data.languages[:2])}",
-                "explanation": "Your language skills meet the position requirements.",
-                "leverage": "Mention specific contexts where you used these languages professionally."
+                **_STRONG_TEMPLATES["languages"],
+                "point": _fmt_top("Language proficiency: ", resume_data.languages, 2),
             })
         
         # Location advantage
         if score_breakdown.get("location_match", 0) >= 90:
-            strong_points.append({
-                "category": "Location",
-                "point": "Optimal location match",
-                "explanation": "Your location aligns perfectly with the job location.",
-                "leverage": "Emphasize your local market knowledge and availability for in-person collaboration."
-            })
+            strong_points.append(dict(_STRONG_TEMPLATES["location"]))
         
-        # Ensure we have at least 3 strong points
-        while len(strong_points) < 3:
+        # Top up with generic strong points when specific ones are limited
+        if len(strong_points) < 3:
             strong_points.extend(self._generate_generic_strong_points(resume_data))
-            strong_points = strong_points[:5]  # Limit to 5
         
         return strong_points[:5]
 
@@ -127,73 +266,45 @@ class GapAnalyzer:
         resume_data: ResumeData,
         job_requirements: JobRequirements,
         score_breakdown: Dict[str, Any],
+        missing_skills: List[str],
     ) -> List[Dict[str, str]]:
         """Identify candidate's weak points."""
         weak_points = []
         
         # Skills gaps
         if score_breakdown.get("skills_match", 0) < 60:
-            missing_skills = self._find_missing_skills(resume_data, job_requirements)
             if missing_skills:
                 weak_points.append({
-                    "category": "Skills",
-                    "point": f"Missing key technical skills: {', '.join(missing_skills[:3])}",
-                    "explanation": "Some required technical skills are not evident in your resume.",
-                    "impact": "This may lead to automatic filtering by ATS systems."
+                    **_WEAK_TEMPLATES["skills"],
+                    "point": _fmt_top("Missing key technical skills: ", missing_skills),
                 })
         
         # Overqualification risk
         overqualification_penalty = score_breakdown.get("overqualification_penalty", 0)
         if overqualification_penalty > 20:
             if resume_data.has_phd and job_requirements.job_level == "junior":
-                weak_points.append({
-                    "category": "Overqualification",
-                    "point": "PhD for junior-level position",
-                    "explanation": "Your advanced degree may be seen as overqualification for this role.",
-                    "impact": "Employers might worry about retention, salary expectations, or cultural fit."
-                })
+                weak_points.append(dict(_WEAK_TEMPLATES["overqualification"]))
             elif resume_data.academic_background and job_requirements.industry not in [
                 "technology", "research", "consulting"
             ]:
-                weak_points.append({
-                    "category": "Industry Fit",
-                    "point": "Academic background for industry role",
-                    "explanation": "Strong academic background may not align with industry expectations.",
-                    "impact": "May be perceived as lacking practical business experience."
-                })
+                weak_points.append(dict(_WEAK_TEMPLATES["industry_fit"]))
         
         # Experience gaps
         if score_breakdown.get("experience_match", 0) < 50:
             if job_requirements.job_level == "senior" and len(resume_data.experience) < 4:
-                weak_points.append({
-                    "category": "Experience",
-                    "point": "Limited professional experience for senior role",
-                    "explanation": "The position requires more extensive industry experience.",
-                    "impact": "May not meet minimum experience requirements."
-                })
+                weak_points.append(dict(_WEAK_TEMPLATES["experience"]))
         
         # Language requirements
         if score_breakdown.get("language_match", 0) < 50:
-            weak_points.append({
-                "category": "Languages",
-                "point": "Language requirements not clearly met",
-                "explanation": "Required language proficiency is not evident in your resume.",
-                "impact": "May be filtered out if language skills are mandatory."
-            })
+            weak_points.append(dict(_WEAK_TEMPLATES["languages"]))
         
         # Education mismatch
         if score_breakdown.get("education_match", 0) < 40:
-            weak_points.append({
-                "category": "Education",
-                "point": "Educational requirements not met",
-                "explanation": "Your educational background doesn't match the specified requirements.",
-                "impact": "May not meet minimum qualification criteria."
-            })
+            weak_points.append(dict(_WEAK_TEMPLATES["education"]))
         
-        # Ensure we have at least 3 weak points
-        while len(weak_points) < 3:
+        # Top up with generic weak points to reach at least 3
+        if len(weak_points) < 3:
             weak_points.extend(self._generate_generic_weak_points(resume_data, job_requirements))
-            weak_points = weak_points[:5]  # Limit to 5
         
         return weak_points[:5]
 
@@ -202,62 +313,38 @@ class GapAnalyzer:
         resume_data: ResumeData,
         job_requirements: JobRequirements,
         weak_points: List[Dict[str, str]],
+        missing_skills: List[str],
     ) -> List[Dict[str, str]]:
         """Generate specific improvement recommendations."""
         improvements = []
         
         # Address skills gaps
-        missing_skills = self._find_missing_skills(resume_data, job_requirements)
         if missing_skills:
             improvements.append({
-                "category": "Skills Enhancement",
-                "recommendation": f"Add experience with: {', '.join(missing_skills[:3])}",
-                "action": "Include any projects, courses, or exposure to these technologies in your resume.",
-                "priority": "High",
-                "impact": "Improves ATS keyword matching and demonstrates technical relevance."
+                **_IMPROVEMENT_TEMPLATES["skills"],
+                "recommendation": _fmt_top("Add experience with: ", missing_skills),
             })
         
         # Address overqualification
         if resume_data.has_phd and job_requirements.job_level in ["junior", "mid"]:
-            improvements.append({
-                "category": "PhD Positioning",
-                "recommendation": "Reframe PhD as practical problem-solving experience",
-                "action": "Focus on transferable skills: analytical thinking, project management, communication.",
-                "priority": "High",
-                "impact": "Reduces overqualification concerns and emphasizes business value."
-            })
+            improvements.append(dict(_IMPROVEMENT_TEMPLATES["phd"]))
         
         # Industry transition advice
         if resume_data.academic_background and job_requirements.industry not in [
             "technology", "research", "consulting"
         ]:
-            improvements.append({
-                "category": "Industry Positioning",
-                "recommendation": "Emphasize business impact over academic achievements",
-                "action": "Quantify results, use business language, highlight practical applications.",
-                "priority": "High",
-                "impact": "Demonstrates industry readiness and practical value."
-            })
+            improvements.append(dict(_IMPROVEMENT_TEMPLATES["industry"]))
         
         # Experience presentation
         if len(resume_data.experience) > 0:
-            improvements.append({
-                "category": "Experience Optimization",
-                "recommendation": "Quantify achievements with specific metrics",
-                "action": "Add numbers: budget managed, team size, performance improvements, etc.",
-                "priority": "Medium",
-                "impact": "Makes your contributions more tangible and impressive."
-            })
+            improvements.append(dict(_IMPROVEMENT_TEMPLATES["experience"]))
         
         # Keyword optimization
-        job_keywords = job_requirements.keywords[:5]
+        job_keywords = job_requirements.keywords
         if job_keywords:
             improvements.append({
-                "category": "Keyword Optimization",
-                "recommendation": f"Include key terms: {', '.join(job_keywords)}",
-                "action": "Naturally integrate these terms throughout your resume content.",
-                "priority": "Medium",
-                "impact": "Improves ATS parsing and keyword density scores."
+                **_IMPROVEMENT_TEMPLATES["keywords"],
+                "recommendation": _fmt_top("Include key terms: ", job_keywords, 5),
             })
         
         return improvements[:5]
@@ -266,29 +353,37 @@ class GapAnalyzer:
         self, resume_data: ResumeData, job_requirements: JobRequirements
     ) -> List[str]:
         """Find skills that match between resume and job requirements."""
-        resume_skills_lower = [skill.lower() for skill in resume_data.skills]
+        resume_skills_lower = resume_data.skills_lower
+        resume_skill_set = set(resume_skills_lower)
+        resume_skill_blob = "\n".join(resume_skills_lower)
         all_job_skills = job_requirements.required_skills + job_requirements.preferred_skills
         job_skills_lower = [skill.lower() for skill in all_job_skills]
         
-        matching = []
+        matching: Dict[str, None] = {}
         for job_skill in job_skills_lower:
-            for resume_skill in resume_skills_lower:
-                if job_skill in resume_skill or resume_skill in job_skill:
-                    matching.append(job_skill.title())
-                    break
-        
-        return list(set(matching))
+            # Exact hit, then job skill inside a resume skill, then the reverse
+            if (
+                job_skill in resume_skill_set
+                or job_skill in resume_skill_blob
+                or any(resume_skill in job_skill for resume_skill in resume_skills_lower)
+            ):
+                matching[job_skill.title()] = None
+        
+        return list(matching)
 
     def _find_missing_skills(
         self, resume_data: ResumeData, job_requirements: JobRequirements
     ) -> List[str]:
         """Find skills that are required but missing from resume."""
-        resume_skills_lower = [skill.lower() for skill in resume_data.skills]
+        resume_skills_lower = resume_data.skills_lower
+        resume_skill_set = set(resume_skills_lower)
+        # Skills never contain newlines, so one search covers every resume skill
+        resume_skill_blob = "\n".join(resume_skills_lower)
         required_skills_lower = [skill.lower() for skill in job_requirements.required_skills]
         
         missing = []
         for req_skill in required_skills_lower:
-            found = any(req_skill in resume_skill for resume_skill in resume_skills_lower)
+            found = req_skill in resume_skill_set or req_skill in resume_skill_blob
             if not found:
                 missing.append(req_skill.title())
         
@@ -301,28 +396,13 @@ class GapAnalyzer:
         generic_points = []
         
         if resume_data.has_phd:
-            generic_points.append({
-                "category": "Research Skills",
-                "point": "Advanced research and analytical capabilities",
-                "explanation": "PhD training provides strong analytical and problem-solving skills.",
-                "leverage": "Emphasize your ability to tackle complex problems systematically."
-            })
+            generic_points.append(dict(_STRONG_TEMPLATES["research"]))
         
         if len(resume_data.skills) > 3:
-            generic_points.append({
-                "category": "Technical Diversity",
-                "point": "Diverse technical skill set",
-                "explanation": "You demonstrate adaptability across multiple technologies.",
-                "leverage": "Show how you can quickly learn and apply new technologies."
-            })
+            generic_points.append(dict(_STRONG_TEMPLATES["diverse_skills"]))
         
         if len(resume_data.languages) > 1:
-            generic_points.append({
-                "category": "Communication",
-                "point": "Multilingual communication abilities",
-                "explanation": "Multiple language skills demonstrate cultural adaptability.",
-                "leverage": "Highlight your ability to work in international environments."
-            })
+            generic_points.append(dict(_STRONG_TEMPLATES["multilingual"]))
         
         return generic_points
 
@@ -330,27 +410,4 @@ class GapAnalyzer:
         self, resume_data: ResumeData, job_requirements: JobRequirements
     ) -> List[Dict[str, str]]:
         """Generate generic weak points when specific ones are limited."""
-        generic_points = []
-        
-        generic_points.append({
-            "category": "Keyword Optimization",
-            "point": "Limited keyword alignment with job description",
-            "explanation": "Your resume may not contain enough keywords from the job posting.",
-            "impact": "ATS systems might not rank your resume highly."
-        })
-        
-        generic_points.append({
-            "category": "Quantification",
-            "point": "Achievements could be more quantified",
-            "explanation": "Your accomplishments lack specific metrics and numbers.",
-            "impact": "Makes it harder for recruiters to assess your impact."
-        })
-        
-        generic_points.append({
-            "category": "Industry Language",
-            "point": "Could use more industry-specific terminology",
-            "explanation": "Your resume might benefit from more business-focused language.",
-            "impact": "May not resonate as strongly with hiring managers."
-        })
-        
-        return generic_points
\ No newline at end of file
+        return [dict(point) for point in _GENERIC_WEAK_POINTS]
@@ -1,17 +1,151 @@
 """Job description analysis module."""
 
+import heapq
 import logging
 import re
-from typing import Dict, List, Optional
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
 from dataclasses import dataclass
+from operator import itemgetter
+from utils.helpers import AnalysisCacheMixin
+from utils.text_search import KeywordMatcher, PatternFamily
 
 logger = logging.getLogger(__name__)
 
+# Distinct job descriptions remembered by each analyzer
+_ANALYSIS_CACHE_SIZE = 512
 
-@dataclass
+
+def _compile_all(*patterns: str) -> Tuple["re.Pattern[str]", ...]:
+    """Compile a family of case-insensitive patterns once at import."""
+    return tuple(re.compile(pattern, re.IGNORECASE) for pattern in patterns)
+
+
+_SKILL_PATTERNS = _compile_all(
+    r'(?:required|must have|essential)[\s\w]*:?\s*([^\n.]+)',
+    r'(?:skills?|technologies?|tools?)[\s\w]*:?\s*([^\n.]+)',
+    r'(?:experience with|proficiency in|knowledge of)\s+([^\n.]+)',
+)
+
+_EXPERIENCE_PATTERNS = _compile_all(
+    r'(\d+)(?:\+|\s*to\s*\d+)?\s*years?\s*(?:of\s*)?experience',
+    r'(?:minimum|at least)\s*(\d+)\s*years?',
+    r'(\d+)(?:\+|\-\d+)?\s*ans?\s*d[\'\'\""]expérience',  # French
+)
+
+_EDUCATION_PATTERNS = _compile_all(
+    r'(bachelor|master|phd|doctorate|degree|diploma)',
+    r'(bac\+\d+|licence|master|doctorat)',  # French
+)
+
+_TITLE_PATTERNS = PatternFamily(
+    r'(?:job title|position|poste|titre)[\s:]*([^\n]+)',
+    r'(?:we are looking for|nous recherchons)[\s\w]*([^\n]+)',
+)
+
+# Substrings, so "Engineering" or "Developers" still count as title-like
+_TITLE_HINTS = ("engineer", "developer", "manager", "analyst", "consultant")
+
+_COMPANY_PATTERNS = PatternFamily(
+    r'(?:company|société|entreprise)[\s:]*([^\n]+)',
+    r'(?:at|chez)\s+([a-z][^\n,]+)',
+)
+
+# Required sections first, preferred second
+_SKILL_SECTIONS = PatternFamily(
+    r'(?:required|must have|essential|obligatoire)[\s\w]*:?\s*([^.]+)',
+    r'(?:preferred|nice to have|bonus|souhaité)[\s\w]*:?\s*([^.]+)',
+)
+
+# Technical skills keywords
+_TECH_SKILLS = (
+    "python", "java", "javascript", "react", "angular", "vue",
+    "sql", "nosql", "mongodb", "postgresql", "mysql",
+    "aws", "azure", "gcp", "docker", "kubernetes",
+    "machine learning", "ai", "data science", "analytics",
+    "agile", "scrum", "git", "ci/cd", "devops"
+)
+
+_TECH_SKILL_MATCHER = KeywordMatcher(_TECH_SKILLS)
+
+_LANGUAGE_PATTERNS = _compile_all(
+    r'(?:fluent|native|proficient|bilingual)\s+(?:in\s+)?(\w+)',
+    r'(\w+)\s+(?:fluency|proficiency|speaker)',
+    r'(?:français|anglais|espagnol|allemand|italien)',
+    r'(?:french|english|spanish|german|italian)',
+)
+
+_LOCATION_PATTERNS = PatternFamily(
+    r'(?:location|lieu|localisation)[\s:]*([^\n]+)',
+    r'(?:based in|situé à|basé à)\s+([^\n,]+)',
+)
+
+_COMPANY_SIZE_PATTERNS = PatternFamily(
+    r'(\d+)(?:\+|\s*to\s*\d+)?\s*(?:employees|people|personnes)',
+    r'(?:startup|start-up|scale-up)',
+    r'(?:sme|pme|large company|grande entreprise)',
+)
+
+_WORD_RE = re.compile(r'\b\w+\b')
+
+# Matched against word tokens, so "lead" no longer fires on "leadership".
+# Plurals the substring scan used to catch are listed explicitly.
+_SENIOR_KEYWORDS = frozenset({
+    "senior", "seniors", "lead", "leads", "principal", "principals",
+    "architect", "architects", "manager", "managers", "director", "directors"
+})
+_JUNIOR_KEYWORDS = frozenset({
+    "junior", "juniors", "entry", "graduate", "graduates", "intern", "interns",
+    "internship", "débutant", "débutants"
+})
+_MID_KEYWORDS = frozenset({"mid", "intermediate", "confirmé"})
+
+# Priority order: the first listed industry found wins
+_INDUSTRIES = (
+    "technology", "tech", "software", "fintech", "healthtech",
+    "consulting", "finance", "healthcare", "automotive",
+    "e-commerce", "retail", "manufacturing", "energy"
+)
+_INDUSTRY_WORDS = frozenset(
+    industry for industry in _INDUSTRIES if _WORD_RE.fullmatch(industry)
+)
+_INDUSTRY_PHRASES = tuple(
+    industry for industry in _INDUSTRIES if industry not in _INDUSTRY_WORDS
+)
+# Inflected tokens the substring scan matched, and the industry it reported
+_INDUSTRY_VARIANTS = {
+    "technologies": "tech",
+    "techs": "tech",
+    "fintechs": "fintech",
+    "healthtechs": "healthtech",
+    "retailer": "retail",
+    "retailers": "retail",
+}
+
+_FRENCH_CITIES = (
+    "paris", "lyon", "marseille", "toulouse", "nice", "nantes", "strasbourg"
+)
+_FRENCH_CITY_SET = frozenset(_FRENCH_CITIES)
+
+_STOP_WORDS = frozenset({
+    "the", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with",
+    "a", "an", "is", "are", "was", "were", "be", "been", "have", "has",
+    "le", "la", "les", "et", "ou", "mais", "dans", "sur", "à", "pour", "de", "avec"
+})
+
+
+@dataclass(frozen=True)
 class JobRequirements:
     """Structured job requirements data."""
     
+    # Declared by hand, dataclass(slots=True) needs Python 3.10
+    __slots__ = (
+        "title", "company", "required_skills", "preferred_skills",
+        "required_experience", "education_requirements", "languages",
+        "location", "industry", "company_size", "job_level", "keywords",
+    )
+    
     title: str
     company: Optional[str]
     required_skills: List[str]
@@ -25,51 +159,66 @@ class JobRequirements:
     job_level: str
     keywords: List[str]
 
+    def __getstate__(self) -> List[Any]:
+        """Return the field values for pickling."""
+        return [getattr(self, name) for name in self.__slots__]
+
+    def __setstate__(self, state: List[Any]) -> None:
+        """Restore the field values of a frozen instance."""
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
 
-class JobAnalyzer:
+class JobAnalyzer(AnalysisCacheMixin):
     """Analyzer for extracting structured data from job descriptions."""
 
+    _analysis_cache_size = _ANALYSIS_CACHE_SIZE
+    _analyze_cached: Callable[[str], JobRequirements]
+
     def __init__(self) -> None:
         """Initialize the job analyzer."""
-        self.skill_patterns = [
-            r'(?:required|must have|essential)[\s\w]*:?\s*([^\n.]+)',
-            r'(?:skills?|technologies?|tools?)[\s\w]*:?\s*([^\n.]+)',
-            r'(?:experience with|proficiency in|knowledge of)\s+([^\n.]+)',
-        ]
-        
-        self.experience_patterns = [
-            r'(\d+)(?:\+|\s*to\s*\d+)?\s*years?\s*(?:of\s*)?experience',
-            r'(?:minimum|at least)\s*(\d+)\s*years?',
-            r'(\d+)(?:\+|\-\d+)?\s*ans?\s*d[\'\'\""]expérience',  # French
-        ]
-        
-        self.education_patterns = [
-            r'(bachelor|master|phd|doctorate|degree|diploma)',
-            r'(bac\+\d+|licence|master|doctorat)',  # French
-        ]
+        self.skill_patterns = list(_SKILL_PATTERNS)
+        self.experience_patterns = list(_EXPERIENCE_PATTERNS)
+        self.education_patterns = list(_EDUCATION_PATTERNS)
+        self._init_cache()
 
     def analyze(self, job_description: str) -> JobRequirements:
         """
         Analyze job description and extract structured requirements.
         
+        Results are cached per analyzer, so a posting scored against many
+        resumes is only analyzed once. The returned requirements are frozen and
+        shared between callers.
+        
         Args:
             job_description: Raw job description text
             
         Returns:
             Structured job requirements
         """
+        return self._analyze_cached(job_description)
+
+    def _analyze(self, job_description: str) -> JobRequirements:
+        """Analyze a job description without caching."""
         try:
-            title = self._extract_job_title(job_description)
-            company = self._extract_company_name(job_description)
-            required_skills, preferred_skills = self._extract_skills(job_description)
+            # Lowercase and tokenize once, shared by the extractors below
+            text_lower = job_description.lower()
+            tokens = _WORD_RE.findall(text_lower)
+            token_set = set(tokens)
+
+            title = self._extract_job_title(job_description, text_lower)
+            company = self._extract_company_name(job_description, text_lower)
+            required_skills, preferred_skills = self._extract_skills(
+                job_description, text_lower
+            )
             required_experience = self._extract_experience_requirement(job_description)
             education_requirements = self._extract_education_requirements(job_description)
             languages = self._extract_language_requirements(job_description)
-            location = self._extract_location(job_description)
-            industry = self._extract_industry(job_description)
-            company_size = self._extract_company_size(job_description)
-            job_level = self._determine_job_level(job_description)
-            keywords = self._extract_keywords(job_description)
+            location = self._extract_location(job_description, text_lower, token_set)
+            industry = self._extract_industry(job_description, text_lower, token_set)
+            company_size = self._extract_company_size(job_description, text_lower)
+            job_level = self._determine_job_level(job_description, token_set)
+            keywords = self._extract_keywords(job_description, tokens)
 
             return JobRequirements(
                 title=title,
@@ -87,7 +236,7 @@ class JobAnalyzer:
             )
             
         except Exception as e:
-            logger.error(f"Error analyzing job description: {str(e)}")
+            logger.error("Error analyzing job description: %s", e)
             return JobRequirements(
                 title="Unknown Position",
                 company=None,
@@ -103,91 +252,89 @@ class JobAnalyzer:
                 keywords=[],
             )
 
-    def _extract_job_title(self, text: str) -> str:
+    def analyze_batch(
+        self, job_descriptions: Sequence[str], workers: Optional[int] = None
+    ) -> List[JobRequirements]:
+        """
+        Analyze several job descriptions.
+        
+        Keyword matchers and pattern families are module constants built once
+        per worker at import; the analyzer itself only carries compiled
+        patterns, which pickle cheaply.
+        
+        Args:
+            job_descriptions: Raw job description texts
+            workers: Number of worker processes, None or 1 to run serially
+            
+        Returns:
+            Structured job requirements, in input order
+        """
+        if workers is not None and workers > 1 and len(job_descriptions) > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    return list(
+                        executor.map(self.analyze, job_descriptions, chunksize=8)
+                    )
+            except Exception as e:
+                logger.error("Error in parallel job analysis, running serially: %s", e)
+        
+        return [self.analyze(job_description) for job_description in job_descriptions]
+
+    def _extract_job_title(self, text: str, text_lower: Optional[str] = None) -> str:
         """Extract job title from description."""
         # Look for common title patterns
-        title_patterns = [
-            r'(?:job title|position|poste|titre)[\s:]*([^\n]+)',
-            r'(?:we are looking for|nous recherchons)[\s\w]*([^\n]+)',
-        ]
-        
-        for pattern in title_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
+        found: Optional[str] = _TITLE_PATTERNS.search(text, text_lower, group=1)
+        if found:
+            return found.strip()
         
         # Fallback: use first line if it looks like a title
-        first_line = text.split('\n')[0].strip()
-        if len(first_line) < 100 and any(word in first_line.lower() for word in 
-                                       ["engineer", "developer", "manager", "analyst", "consultant"]):
-            return first_line
+        first_line = text.partition('\n')[0].strip()
+        if len(first_line) < 100:
+            first_line_lower = first_line.lower()
+            if any(hint in first_line_lower for hint in _TITLE_HINTS):
+                return first_line
         
         return "Position"
 
-    def _extract_company_name(self, text: str) -> Optional[str]:
+    def _extract_company_name(
+        self, text: str, text_lower: Optional[str] = None
+    ) -> Optional[str]:
         """Extract company name from description."""
-        company_patterns = [
-            r'(?:company|société|entreprise)[\s:]*([^\n]+)',
-            r'(?:at|chez)\s+([A-Z][^\n,]+)',
-        ]
-        
-        for pattern in company_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
+        found: Optional[str] = _COMPANY_PATTERNS.search(text, text_lower, group=1)
+        if found:
+            return found.strip()
         
         return None
 
-    def _extract_skills(self, text: str) -> tuple[List[str], List[str]]:
+    def _extract_skills(
+        self, text: str, text_lower: Optional[str] = None
+    ) -> tuple[List[str], List[str]]:
         """Extract required and preferred skills."""
-        required_skills = []
-        preferred_skills = []
-        
-        # Technical skills keywords
-        tech_skills = [
-            "python", "java", "javascript", "react", "angular", "vue",
-            "sql", "nosql", "mongodb", "postgresql", "mysql",
-            "aws", "azure", "gcp", "docker", "kubernetes",
-            "machine learning", "ai", "data science", "analytics",
-            "agile", "scrum", "git", "ci/cd", "devops"
-        ]
-        
-        text_lower = text.lower()
-        
-        # Look for required skills sections
-        required_sections = re.findall(
-            r'(?:required|must have|essential|obligatoire)[\s\w]*:?\s*([^.]+)', 
-            text, re.IGNORECASE
-        )
-        
-        for section in required_sections:
-            for skill in tech_skills:
-                if skill in section.lower():
-                    required_skills.append(skill)
+        if text_lower is None:
+            text_lower = text.lower()
         
-        # Look for preferred skills sections
-        preferred_sections = re.findall(
-            r'(?:preferred|nice to have|bonus|souhaité)[\s\w]*:?\s*([^.]+)', 
-            text, re.IGNORECASE
-        )
+        # Dicts keep first-seen order while deduplicating
+        required_skills: Dict[str, None] = {}
+        preferred_skills: Dict[str, None] = {}
         
-        for section in preferred_sections:
-            for skill in tech_skills:
-                if skill in section.lower():
-                    preferred_skills.append(skill)
+        # Look for required and preferred skills sections
+        for kind, section in _SKILL_SECTIONS.findall(text_lower):
+            found = dict.fromkeys(_TECH_SKILL_MATCHER.find(section))
+            if kind == 0:
+                required_skills.update(found)
+            else:
+                preferred_skills.update(found)
         
         # If no clear sections, categorize all found skills as required
         if not required_skills and not preferred_skills:
-            for skill in tech_skills:
-                if skill in text_lower:
-                    required_skills.append(skill)
+            required_skills.update(dict.fromkeys(_TECH_SKILL_MATCHER.find(text_lower)))
         
-        return list(set(required_skills)), list(set(preferred_skills))
+        return list(required_skills), list(preferred_skills)
 
     def _extract_experience_requirement(self, text: str) -> Optional[str]:
         """Extract experience requirements."""
         for pattern in self.experience_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+            match = pattern.search(text)
             if match:
                 return match.group()
         
@@ -195,118 +342,111 @@ class JobAnalyzer:
 
     def _extract_education_requirements(self, text: str) -> List[str]:
         """Extract education requirements."""
-        education = []
+        education: Dict[str, None] = {}
         
         for pattern in self.education_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+            matches = pattern.finditer(text)
             for match in matches:
-                education.append(match.group())
+                education[match.group()] = None
         
-        return list(set(education))
+        return list(education)
 
     def _extract_language_requirements(self, text: str) -> List[str]:
         """Extract language requirements."""
-        language_patterns = [
-            r'(?:fluent|native|proficient|bilingual)\s+(?:in\s+)?(\w+)',
-            r'(\w+)\s+(?:fluency|proficiency|speaker)',
-            r'(?:français|anglais|espagnol|allemand|italien)',
-            r'(?:french|english|spanish|german|italian)',
-        ]
-        
-        languages = []
-        for pattern in language_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        languages: Dict[str, None] = {}
+        for pattern in _LANGUAGE_PATTERNS:
+            matches = pattern.finditer(text)
             for match in matches:
-                languages.append(match.group().strip())
+                languages[match.group().strip()] = None
         
-        return list(set(languages))
+        return list(languages)
 
-    def _extract_location(self, text: str) -> Optional[str]:
+    def _extract_location(
+        self,
+        text: str,
+        text_lower: Optional[str] = None,
+        token_set: Optional[Set[str]] = None,
+    ) -> Optional[str]:
         """Extract job location."""
-        location_patterns = [
-            r'(?:location|lieu|localisation)[\s:]*([^\n]+)',
-            r'(?:based in|situé à|basé à)\s+([^\n,]+)',
-        ]
-        
-        for pattern in location_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
+        found: Optional[str] = _LOCATION_PATTERNS.search(text, text_lower, group=1)
+        if found:
+            return found.strip()
         
         # Look for French cities
-        french_cities = ["paris", "lyon", "marseille", "toulouse", "nice", "nantes", "strasbourg"]
-        text_lower = text.lower()
+        if token_set is None:
+            token_set = set(_WORD_RE.findall(text_lower or text.lower()))
         
-        for city in french_cities:
-            if city in text_lower:
-                return city.title()
+        cities = token_set & _FRENCH_CITY_SET
+        if cities:
+            return min(cities, key=_FRENCH_CITIES.index).title()
         
         return None
 
-    def _extract_industry(self, text: str) -> Optional[str]:
+    def _extract_industry(
+        self,
+        text: str,
+        text_lower: Optional[str] = None,
+        token_set: Optional[Set[str]] = None,
+    ) -> Optional[str]:
         """Extract industry information."""
-        industries = [
-            "technology", "tech", "software", "fintech", "healthtech",
-            "consulting", "finance", "healthcare", "automotive",
-            "e-commerce", "retail", "manufacturing", "energy"
-        ]
-        
-        text_lower = text.lower()
-        for industry in industries:
-            if industry in text_lower:
-                return industry.title()
+        if text_lower is None:
+            text_lower = text.lower()
+        if token_set is None:
+            token_set = set(_WORD_RE.findall(text_lower))
+        
+        # Single words are set lookups, only hyphenated entries need a scan
+        found = token_set & _INDUSTRY_WORDS
+        found.update(
+            _INDUSTRY_VARIANTS[token] for token in token_set & _INDUSTRY_VARIANTS.keys()
+        )
+        found.update(
+            industry for industry in _INDUSTRY_PHRASES if industry in text_lower
+        )
+        if found:
+            return min(found, key=_INDUSTRIES.index).title()
         
         return None
 
-    def _extract_company_size(self, text: str) -> Optional[str]:
+    def _extract_company_size(
+        self, text: str, text_lower: Optional[str] = None
+    ) -> Optional[str]:
         """Extract company size information."""
-        size_patterns = [
-            r'(\d+)(?:\+|\s*to\s*\d+)?\s*(?:employees|people|personnes)',
-            r'(?:startup|start-up|scale-up)',
-            r'(?:sme|pme|large company|grande entreprise)',
-        ]
-        
-        for pattern in size_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group().strip()
+        found: Optional[str] = _COMPANY_SIZE_PATTERNS.search(text, text_lower)
+        if found:
+            return found.strip()
         
         return None
 
-    def _determine_job_level(self, text: str) -> str:
+    def _determine_job_level(
+        self, text: str, token_set: Optional[Set[str]] = None
+    ) -> str:
         """Determine job seniority level."""
-        text_lower = text.lower()
-        
-        senior_keywords = ["senior", "lead", "principal", "architect", "manager", "director"]
-        junior_keywords = ["junior", "entry", "graduate", "intern", "débutant"]
-        mid_keywords = ["mid", "intermediate", "confirmé"]
+        if token_set is None:
+            token_set = set(_WORD_RE.findall(text.lower()))
         
-        if any(keyword in text_lower for keyword in senior_keywords):
+        if not _SENIOR_KEYWORDS.isdisjoint(token_set):
             return "senior"
-        elif any(keyword in text_lower for keyword in junior_keywords):
+        elif not _JUNIOR_KEYWORDS.isdisjoint(token_set):
             return "junior"
-        elif any(keyword in text_lower for keyword in mid_keywords):
+        elif not _MID_KEYWORDS.isdisjoint(token_set):
             return "mid"
         
         return "mid"  # Default
 
-    def _extract_keywords(self, text: str) -> List[str]:
+    def _extract_keywords(
+        self, text: str, tokens: Optional[List[str]] = None
+    ) -> List[str]:
         """Extract important keywords from job description."""
         # Remove common stop words and extract meaningful terms
-        stop_words = {
-            "the", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with",
-            "a", "an", "is", "are", "was", "were", "be", "been", "have", "has",
-            "le", "la", "les", "et", "ou", "mais", "dans", "sur", "à", "pour", "de", "avec"
-        }
-        
-        words = re.findall(r'\b\w+\b', text.lower())
-        keywords = [word for word in words if len(word) > 3 and word not in stop_words]
-        
-        # Count frequency and return most common
-        word_freq: Dict[str, int] = {}
-        for word in keywords:
-            word_freq[word] = word_freq.get(word, 0) + 1
+        if tokens is None:
+            tokens = _WORD_RE.findall(text.lower())
+        
+        # Count every token in C first, then filter the distinct words only
+        word_freq = Counter(tokens)
+        candidates = (
+            (word, count) for word, count in word_freq.items()
+            if len(word) > 3 and word not in _STOP_WORDS
+        )
         
-        # Sort by frequency and return top 20
-        sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-        return [word for word, _ in sorted_words[:20]]
\ No newline at end of file
+        # nlargest is stable, ties keep their first-seen order
+        return [word for word, _ in heapq.nlargest(20, candidates, key=itemgetter(1))]
@@ -2,16 +2,95 @@
 
 import logging
 import re
-from typing import Dict, List, Optional, Any
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Any, Sequence
 from dataclasses import dataclass
+from utils.helpers import AnalysisCacheMixin
+from utils.text_search import KeywordGroups, KeywordMatcher, PatternFamily
 
 logger = logging.getLogger(__name__)
 
+_ANALYSIS_CACHE_SIZE = 1024
 
-@dataclass
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+
+# Phone (French formats)
+_PHONE_RES = (
+    re.compile(r'\+33\s?[1-9](?:[\s.-]?\d{2}){4}'),
+    re.compile(r'0[1-9](?:[\s.-]?\d{2}){4}'),
+)
+
+# All degree levels in one alternation, so the resume is walked only once.
+# The field stays on the degree's line so later degrees are not swallowed.
+_DEGREE_RE = re.compile(
+    r'\b(?P<degree>'
+    r'phd|ph\.d|doctorate|doctoral|doctor of philosophy'
+    r'|master|m\.sc|m\.s|m\.a|msc|ma'
+    r'|bachelor|b\.sc|b\.s|b\.a|bsc|ba'
+    r'|engineering degree|diplôme d\'ingénieur'
+    r")(?:'?s)?\.?(?!\w)[^\S\n]*(?:in[^\S\n]+)?(?P<field>[^\n,]*)",
+    re.IGNORECASE,
+)
+
+# Common technical skills
+_SKILL_KEYWORDS = (
+    "python", "java", "javascript", "c++", "sql", "html", "css",
+    "machine learning", "data science", "artificial intelligence",
+    "project management", "agile", "scrum", "git", "docker",
+    "aws", "azure", "linux", "windows", "excel", "powerpoint"
+)
+
+_LANGUAGE_KEYWORDS = (
+    "french", "english", "spanish", "german", "italian",
+    "français", "anglais", "espagnol", "allemand", "italien"
+)
+
+_CERT_KEYWORDS = (
+    "certified", "certification", "certificate", "diploma",
+    "aws certified", "microsoft certified", "google certified",
+    "pmp", "scrum master", "agile"
+)
+
+_EXPERIENCE_KEYWORDS = (
+    "engineer", "developer", "manager", "analyst", "consultant",
+    "researcher", "scientist", "professor", "director", "lead"
+)
+
+_LOCATION_KEYWORDS = ("paris", "lyon", "marseille", "toulouse", "nice", "france")
+
+# Literals one of which every publication pattern match contains
+_PUBLICATION_KEYWORDS = (
+    "published", "publication", "paper", "article", "journal", "conference"
+)
+
+# Interned display forms, so every resume shares one "Python" string object
+_CANONICAL_NAMES: Dict[str, str] = {
+    keyword: sys.intern(keyword.title())
+    for keyword in (
+        _SKILL_KEYWORDS + _LANGUAGE_KEYWORDS + _CERT_KEYWORDS + _LOCATION_KEYWORDS
+    )
+}
+
+# Both patterns hold greedy ``.*`` runs, so they go through the linear-time
+# engine when google-re2 is installed
+_PUB_PATTERNS = PatternFamily(
+    r'(?:published|publication|paper|article|journal).*["\']([^"\']+)["\']',
+    r'(\d{4}).*(?:published|journal|conference).*([^\n]+)',
+)
+
+
+@dataclass(frozen=True)
 class ResumeData:
     """Structured resume data."""
     
+    # Declared by hand, dataclass(slots=True) needs Python 3.10
+    __slots__ = (
+        "contact_info", "education", "experience", "skills", "languages",
+        "publications", "certifications", "has_phd", "academic_background",
+        "skills_lower", "languages_lower", "location_lower",
+    )
+    
     contact_info: Dict[str, Optional[str]]
     education: List[Dict[str, str]]
     experience: List[Dict[str, str]]
@@ -21,44 +100,130 @@ class ResumeData:
     certifications: List[str]
     has_phd: bool
     academic_background: bool
+    # The lowercased forms for the scorers are slots set in __post_init__,
+    # not dataclass fields, so they stay out of __init__, repr and eq
+
+    def __post_init__(self) -> None:
+        """Normalize skills, languages and location once for comparisons."""
+        self.skills_lower: List[str]
+        self.languages_lower: List[str]
+        self.location_lower: str
+        object.__setattr__(
+            self, "skills_lower", [sys.intern(skill.lower()) for skill in self.skills]
+        )
+        object.__setattr__(
+            self, "languages_lower", [language.lower() for language in self.languages]
+        )
+        object.__setattr__(
+            self,
+            "location_lower",
+            (self.contact_info.get("location") or "").lower(),
+        )
+
+    def __getstate__(self) -> List[Any]:
+        """Return the field values for pickling."""
+        return [getattr(self, name) for name in self.__slots__]
+
+    def __setstate__(self, state: List[Any]) -> None:
+        """Restore the field values of a frozen instance."""
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
 
+# State of the current batch worker process, filled in by _init_worker
+_WORKER_STATE: Dict[str, "ResumeAnalyzer"] = {}
 
-class ResumeAnalyzer:
+
+def _init_worker() -> None:
+    """Build the analyzer, and its keyword automata, once per worker process."""
+    _WORKER_STATE["analyzer"] = ResumeAnalyzer()
+
+
+def _analyze_in_worker(resume_text: str) -> "ResumeData":
+    """Analyze one resume with the worker's analyzer."""
+    analyzer = _WORKER_STATE.get("analyzer")
+    if analyzer is None:
+        raise RuntimeError("Worker process was started without _init_worker")
+    return analyzer.analyze(resume_text)
+
+
+class ResumeAnalyzer(AnalysisCacheMixin):
     """Analyzer for extracting structured data from resume text."""
 
+    _analysis_cache_size = _ANALYSIS_CACHE_SIZE
+    _analyze_cached: Callable[[str], ResumeData]
+
     def __init__(self) -> None:
         """Initialize the resume analyzer."""
-        self.phd_keywords = [
+        self.phd_keywords = frozenset((
             "phd", "ph.d", "doctorate", "doctoral", "doctor of philosophy",
             "dissertation", "thesis", "research", "publication", "postdoc"
-        ]
-        self.academic_keywords = [
+        ))
+        self.academic_keywords = frozenset((
             "university", "professor", "academic", "researcher", "scholar",
             "laboratory", "lab", "institute", "faculty", "postdoctoral"
-        ]
+        ))
+        
+        # Every keyword set is scanned in a single pass. PhD, academic,
+        # certification and location keywords are stems ("publication",
+        # "certif...") and keep substring semantics.
+        self._keyword_groups = KeywordGroups(
+            {
+                "skill": _SKILL_KEYWORDS,
+                "language": _LANGUAGE_KEYWORDS,
+                "cert": _CERT_KEYWORDS,
+                "phd": self.phd_keywords,
+                "academic": self.academic_keywords,
+                "location": _LOCATION_KEYWORDS,
+                "publication": _PUBLICATION_KEYWORDS,
+            },
+            whole_words=("skill", "language"),
+        )
+        # Job title words, matched as substrings anywhere on a line
+        self._experience_matcher = KeywordMatcher(
+            _EXPERIENCE_KEYWORDS, whole_words=False
+        )
+        self._init_cache()
 
     def analyze(self, resume_text: str) -> ResumeData:
         """
         Analyze resume text and extract structured data.
         
+        Results are cached per analyzer, so a resume compared against many
+        job postings is only analyzed once. The returned data is frozen and
+        shared between callers.
+        
         Args:
             resume_text: Raw resume text
             
         Returns:
             Structured resume data
         """
+        return self._analyze_cached(resume_text)
+
+    def _analyze(self, resume_text: str) -> ResumeData:
+        """Analyze resume text without caching."""
         try:
             resume_lower = resume_text.lower()
+            keyword_hits = self._keyword_groups.find(resume_lower)
             
-            contact_info = self._extract_contact_info(resume_text)
+            contact_info = self._extract_contact_info(
+                resume_text, resume_lower, keyword_hits
+            )
             education = self._extract_education(resume_text)
-            experience = self._extract_experience(resume_text)
-            skills = self._extract_skills(resume_text)
-            languages = self._extract_languages(resume_text)
-            publications = self._extract_publications(resume_text)
-            certifications = self._extract_certifications(resume_text)
-            has_phd = self._detect_phd(resume_lower)
-            academic_background = self._detect_academic_background(resume_lower)
+            experience = self._extract_experience(
+                resume_text, resume_text.split('\n'), resume_lower
+            )
+            skills = self._extract_skills(resume_text, keyword_hits)
+            languages = self._extract_languages(resume_text, keyword_hits)
+            publications = self._extract_publications(
+                resume_text, resume_lower, keyword_hits
+            )
+            certifications = self._extract_certifications(resume_text, keyword_hits)
+            has_phd = self._detect_phd(resume_lower, keyword_hits)
+            academic_background = self._detect_academic_background(
+                resume_lower, keyword_hits, has_phd
+            )
 
             return ResumeData(
                 contact_info=contact_info,
@@ -73,7 +238,7 @@ class ResumeAnalyzer:
             )
             
         except Exception as e:
-            logger.error(f"Error analyzing resume: {str(e)}")
+            logger.error("Error analyzing resume: %s", e)
             return ResumeData(
                 contact_info={},
                 education=[],
@@ -86,156 +251,189 @@ class ResumeAnalyzer:
                 academic_background=False,
             )
 
-    def _extract_contact_info(self, text: str) -> Dict[str, Optional[str]]:
+    def analyze_batch(
+        self, resume_texts: Sequence[str], workers: Optional[int] = None
+    ) -> List[ResumeData]:
+        """
+        Analyze several resumes.
+        
+        Each worker process builds its own analyzer in its initializer, so the
+        keyword automata are never pickled along with the tasks.
+        
+        Args:
+            resume_texts: Raw resume texts
+            workers: Number of worker processes, None or 1 to run serially
+            
+        Returns:
+            Structured resume data, in input order
+        """
+        if workers is not None and workers > 1 and len(resume_texts) > 1:
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=workers, initializer=_init_worker
+                ) as executor:
+                    return list(
+                        executor.map(_analyze_in_worker, resume_texts, chunksize=32)
+                    )
+            except Exception as e:
+                logger.error(
+                    "Error in parallel resume analysis, running serially: %s", e
+                )
+        
+        return [self.analyze(resume_text) for resume_text in resume_texts]
+
+    def _find_keywords(
+        self, text: str, keyword_hits: Optional[Dict[str, List[str]]] = None
+    ) -> Dict[str, List[str]]:
+        """Return the keyword hits per category, scanning only if not given."""
+        if keyword_hits is None:
+            # Lowercase only when a scan is needed, analyze() passes its hits
+            keyword_hits = self._keyword_groups.find(text.lower())
+        return keyword_hits
+
+    def _extract_contact_info(
+        self,
+        text: str,
+        text_lower: Optional[str] = None,
+        keyword_hits: Optional[Dict[str, List[str]]] = None,
+    ) -> Dict[str, Optional[str]]:
         """Extract contact information from resume."""
         contact: Dict[str, Optional[str]] = {"email": None, "phone": None, "location": None}
         
-        # Email
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        email_match = re.search(email_pattern, text)
-        if email_match:
-            contact["email"] = email_match.group()
+        # Email, the regex opens on a character class and scans slowly, so
+        # skip it when the text can't hold an address
+        if "@" in text:
+            email_match = _EMAIL_RE.search(text)
+            if email_match:
+                contact["email"] = email_match.group()
         
         # Phone (French formats)
-        phone_patterns = [
-            r'\+33\s?[1-9](?:[\s.-]?\d{2}){4}',
-            r'0[1-9](?:[\s.-]?\d{2}){4}',
-        ]
-        for pattern in phone_patterns:
-            phone_match = re.search(pattern, text)
+        for pattern in _PHONE_RES:
+            phone_match = pattern.search(text)
             if phone_match:
                 contact["phone"] = phone_match.group()
                 break
         
         # Location (basic extraction)
-        location_keywords = ["paris", "lyon", "marseille", "toulouse", "nice", "france"]
-        for keyword in location_keywords:
-            if keyword in text.lower():
-                contact["location"] = keyword.title()
-                break
+        locations = self._find_keywords(
+            text if text_lower is None else text_lower, keyword_hits
+        )["location"]
+        if locations:
+            contact["location"] = _CANONICAL_NAMES[locations[0]]
         
         return contact
 
     def _extract_education(self, text: str) -> List[Dict[str, str]]:
         """Extract education information from resume."""
-        education = []
-        
-        # Look for degree patterns
-        degree_patterns = [
-            r'(phd|ph\.d|doctorate|doctoral|doctor of philosophy)[\s\w]*(?:in\s+)?([^\n,]+)',
-            r'(master|m\.s|m\.a|msc|ma)[\s\w]*(?:in\s+)?([^\n,]+)',
-            r'(bachelor|b\.s|b\.a|bsc|ba)[\s\w]*(?:in\s+)?([^\n,]+)',
-            r'(engineering degree|diplôme d\'ingénieur)[\s\w]*(?:in\s+)?([^\n,]+)',
+        return [
+            {
+                "degree": match.group("degree"),
+                "field": match.group("field").strip(),
+                "type": "degree",
+            }
+            for match in _DEGREE_RE.finditer(text)
         ]
-        
-        for pattern in degree_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                education.append({
-                    "degree": match.group(1),
-                    "field": match.group(2).strip() if len(match.groups()) > 1 else "",
-                    "type": "degree"
-                })
-        
-        return education
 
-    def _extract_experience(self, text: str) -> List[Dict[str, str]]:
+    def _extract_experience(
+        self,
+        text: str,
+        lines: Optional[List[str]] = None,
+        text_lower: Optional[str] = None,
+    ) -> List[Dict[str, str]]:
         """Extract work experience from resume."""
-        experience = []
+        experience: List[Dict[str, str]] = []
         
-        # Look for job titles and companies
-        experience_keywords = [
-            "engineer", "developer", "manager", "analyst", "consultant",
-            "researcher", "scientist", "professor", "director", "lead"
-        ]
+        if lines is None:
+            lines = text.split('\n')
+        if text_lower is None:
+            text_lower = text.lower()
         
-        lines = text.split('\n')
-        for line in lines:
-            line_lower = line.lower()
-            for keyword in experience_keywords:
-                if keyword in line_lower and len(line.strip()) > 10:
-                    experience.append({
-                        "title": line.strip(),
-                        "type": "work_experience"
-                    })
-                    break
+        # Look for job titles and companies in one pass over the whole text.
+        # Lowercasing never adds or removes newlines, so hits map onto lines.
+        line_index = 0
+        line_start = 0
+        for start, _ in self._experience_matcher.finditer(text_lower):
+            if start < line_start:
+                continue  # Line already handled
+            line_index += text_lower.count('\n', line_start, start)
+            line = lines[line_index].strip()
+            if len(line) > 10:
+                experience.append({
+                    "title": line,
+                    "type": "work_experience"
+                })
+                if len(experience) == 5:
+                    break  # Limit to top 5 entries
+            line_end = text_lower.find('\n', start)
+            if line_end == -1:
+                break
+            line_start = line_end + 1
+            line_index += 1
         
-        return experience[:5]  # Limit to top 5 entries
+        return experience
 
-    def _extract_skills(self, text: str) -> List[str]:
+    def _extract_skills(
+        self, text: str, keyword_hits: Optional[Dict[str, List[str]]] = None
+    ) -> List[str]:
         """Extract skills from resume."""
-        # Common technical skills
-        skill_keywords = [
-            "python", "java", "javascript", "c++", "sql", "html", "css",
-            "machine learning", "data science", "artificial intelligence",
-            "project management", "agile", "scrum", "git", "docker",
-            "aws", "azure", "linux", "windows", "excel", "powerpoint"
-        ]
-        
-        skills = []
-        text_lower = text.lower()
-        
-        for skill in skill_keywords:
-            if skill in text_lower:
-                skills.append(skill.title())
-        
-        return list(set(skills))  # Remove duplicates
+        skills = self._find_keywords(text, keyword_hits)["skill"]
+        return [_CANONICAL_NAMES[skill] for skill in skills]
 
-    def _extract_languages(self, text: str) -> List[str]:
+    def _extract_languages(
+        self, text: str, keyword_hits: Optional[Dict[str, List[str]]] = None
+    ) -> List[str]:
         """Extract languages from resume."""
-        language_keywords = [
-            "french", "english", "spanish", "german", "italian",
-            "français", "anglais", "espagnol", "allemand", "italien"
-        ]
-        
-        languages = []
-        text_lower = text.lower()
-        
-        for language in language_keywords:
-            if language in text_lower:
-                languages.append(language.title())
-        
-        return list(set(languages))
+        languages = self._find_keywords(text, keyword_hits)["language"]
+        return [_CANONICAL_NAMES[language] for language in languages]
 
-    def _extract_publications(self, text: str) -> List[str]:
+    def _extract_publications(
+        self,
+        text: str,
+        text_lower: Optional[str] = None,
+        keyword_hits: Optional[Dict[str, List[str]]] = None,
+    ) -> List[str]:
         """Extract publications from resume."""
-        publications = []
+        publications: List[str] = []
         
-        # Look for publication patterns
-        pub_patterns = [
-            r'(?:published|publication|paper|article|journal).*["\']([^"\']+)["\']',
-            r'(\d{4}).*(?:published|journal|conference).*([^\n]+)',
-        ]
+        # The keyword pass already tells whether any pattern can match, which
+        # spares most resumes the greedy regex scans
+        if not self._find_keywords(
+            text if text_lower is None else text_lower, keyword_hits
+        )["publication"]:
+            return publications
         
-        for pattern in pub_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                publications.append(match.group().strip())
+        # Look for publication patterns
+        for match in _PUB_PATTERNS.finditer(text, text_lower):
+            publications.append(match.strip())
+            if len(publications) == 3:
+                break  # Limit to top 3
         
-        return publications[:3]  # Limit to top 3
+        return publications
 
-    def _extract_certifications(self, text: str) -> List[str]:
+    def _extract_certifications(
+        self, text: str, keyword_hits: Optional[Dict[str, List[str]]] = None
+    ) -> List[str]:
         """Extract certifications from resume."""
-        cert_keywords = [
-            "certified", "certification", "certificate", "diploma",
-            "aws certified", "microsoft certified", "google certified",
-            "pmp", "scrum master", "agile"
-        ]
-        
-        certifications = []
-        text_lower = text.lower()
-        
-        for cert in cert_keywords:
-            if cert in text_lower:
-                certifications.append(cert.title())
-        
-        return list(set(certifications))
+        certifications = self._find_keywords(text, keyword_hits)["cert"]
+        return [_CANONICAL_NAMES[cert] for cert in certifications]
 
-    def _detect_phd(self, text_lower: str) -> bool:
+    def _detect_phd(
+        self, text_lower: str, keyword_hits: Optional[Dict[str, List[str]]] = None
+    ) -> bool:
         """Detect if candidate has a PhD."""
-        return any(keyword in text_lower for keyword in self.phd_keywords)
+        return bool(self._find_keywords(text_lower, keyword_hits)["phd"])
 
-    def _detect_academic_background(self, text_lower: str) -> bool:
+    def _detect_academic_background(
+        self,
+        text_lower: str,
+        keyword_hits: Optional[Dict[str, List[str]]] = None,
+        has_phd: Optional[bool] = None,
+    ) -> bool:
         """Detect if candidate has strong academic background."""
-        academic_count = sum(1 for keyword in self.academic_keywords if keyword in text_lower)
-        return academic_count >= 2 or self._detect_phd(text_lower)
\ No newline at end of file
+        keyword_hits = self._find_keywords(text_lower, keyword_hits)
+        if len(keyword_hits["academic"]) >= 2:
+            return True
+        # A PhD already detected by the caller needs no second look
+        if has_phd is None:
+            has_phd = self._detect_phd(text_lower, keyword_hits)
+        return has_phd
\ No newline at end of file
@@ -1,12 +1,58 @@
 """Compatibility scoring module for resume-job matching."""
 
 import logging
-from typing import Dict, Any, Tuple
-from analyzer.resume_analyzer import ResumeData
-from analyzer.job_analyzer import JobRequirements
+from typing import Dict, Any, List, Sequence, Tuple
+
+try:
+    import numpy as np
+
+    _HAS_NUMPY = True
+except ImportError:
+    # numpy not available, batch scoring falls back to one job at a time
+    _HAS_NUMPY = False
+
+from .resume_analyzer import ResumeData
+from .job_analyzer import JobRequirements
 
 logger = logging.getLogger(__name__)
 
+# Industries where an academic background is not penalised
+_ACADEMIC_FRIENDLY_INDUSTRIES = ("technology", "research", "consulting", "education")
+
+# Highest sub-scores and lowest penalty the criteria after skills can reach
+_BEST_CASE_SCORES: Dict[str, float] = {
+    "experience_match": 90.0,
+    "education_match": 100.0,
+    "overqualification_penalty": 0.0,
+    "language_match": 100.0,
+    "location_match": 100.0,
+}
+
+
+def _count_matches(
+    resume_lower: Sequence[str], *needle_lists: Sequence[str]
+) -> List[int]:
+    """
+    Count, per list, the needles contained in any lowercased resume entry.
+    
+    Args:
+        resume_lower: Lowercased resume skills or languages
+        needle_lists: Lowercased job skills or languages to look for
+        
+    Returns:
+        Number of matched needles for each list
+    """
+    if not resume_lower:
+        return [0] * len(needle_lists)
+    
+    resume_set = set(resume_lower)
+    # Entries never contain newlines, so one search covers every resume entry
+    resume_blob = "\n".join(resume_lower)
+    return [
+        sum(1 for needle in needles if needle in resume_set or needle in resume_blob)
+        for needles in needle_lists
+    ]
+
 
 class CompatibilityScorer:
     """Scorer for calculating resume-job compatibility."""
@@ -23,25 +69,55 @@ class CompatibilityScorer:
         }
 
     def calculate_score(
-        self, resume_data: ResumeData, job_requirements: JobRequirements
+        self,
+        resume_data: ResumeData,
+        job_requirements: JobRequirements,
+        min_threshold: int = 0,
     ) -> Tuple[int, Dict[str, Any]]:
         """
         Calculate compatibility score between resume and job.
         
+        With a min_threshold, the skills match is scored first and the other
+        criteria are skipped when even their best values could not lift the
+        total to the threshold. The returned score is then that upper bound,
+        the breakdown holds the best-case value of each skipped criterion and
+        its "below_threshold" key is True.
+        
         Args:
             resume_data: Structured resume data
             job_requirements: Structured job requirements
+            min_threshold: Score below which the full calculation is skipped
             
         Returns:
             Tuple of (score, breakdown) where score is 0-100 and breakdown contains details
         """
         try:
-            breakdown = {}
+            breakdown: Dict[str, Any] = {}
             
             # Calculate individual scores
             skills_score = self._calculate_skills_match(resume_data, job_requirements)
             breakdown["skills_match"] = skills_score
             
+            if min_threshold > 0:
+                # Best case for the rest: top sub-scores and no penalty
+                upper_bound = max(0, min(100, int(self._weighted_total(
+                    skills_score,
+                    _BEST_CASE_SCORES["experience_match"],
+                    _BEST_CASE_SCORES["education_match"],
+                    _BEST_CASE_SCORES["language_match"],
+                    _BEST_CASE_SCORES["location_match"],
+                    _BEST_CASE_SCORES["overqualification_penalty"],
+                ))))
+                if upper_bound < min_threshold:
+                    breakdown.update(_BEST_CASE_SCORES)
+                    breakdown["final_score"] = upper_bound
+                    breakdown["below_threshold"] = True
+                    breakdown["score_explanation"] = (
+                        f"Below the {min_threshold}% threshold "
+                        f"(at most {upper_bound}%)."
+                    )
+                    return upper_bound, breakdown
+            
             experience_score = self._calculate_experience_match(resume_data, job_requirements)
             breakdown["experience_match"] = experience_score
             
@@ -59,29 +135,90 @@ class CompatibilityScorer:
             location_score = self._calculate_location_match(resume_data, job_requirements)
             breakdown["location_match"] = location_score
             
-            # Calculate weighted total
-            total_score = (
-                skills_score * self.weights["skills_match"] +
-                experience_score * self.weights["experience_match"] +
-                education_score * self.weights["education_match"] +
-                language_score * self.weights["language_match"] +
-                location_score * self.weights["location_match"]
-            ) - (overqualification_penalty * self.weights["overqualification_penalty"])
+            total_score = self._weighted_total(
+                skills_score, experience_score, education_score,
+                language_score, location_score, overqualification_penalty,
+            )
             
             # Ensure score is between 0 and 100
             final_score = max(0, min(100, int(total_score)))
             
             breakdown["final_score"] = final_score
-            breakdown["score_explanation"] = self._generate_score_explanation(  # type: ignore
+            breakdown["score_explanation"] = self._generate_score_explanation(
                 final_score, breakdown
             )
             
             return final_score, breakdown
             
         except Exception as e:
-            logger.error(f"Error calculating compatibility score: {str(e)}")
+            logger.error("Error calculating compatibility score: %s", e)
             return 0, {"error": str(e), "score_explanation": "Error in calculation"}
 
+    def calculate_scores_batch(
+        self, resume_data: ResumeData, jobs: Sequence[JobRequirements]
+    ) -> List[int]:
+        """
+        Calculate the compatibility score of one resume against many jobs.
+        
+        Each job is scored by the same _calculate_* methods as calculate_score,
+        without building a breakdown or explanation, and the weighted totals
+        are then computed as array operations over all jobs. Scores are
+        identical to those of calculate_score.
+        
+        Args:
+            resume_data: Structured resume data
+            jobs: Structured requirements of every job
+            
+        Returns:
+            Score from 0 to 100 for each job, in input order
+        """
+        if not _HAS_NUMPY:
+            return [self.calculate_score(resume_data, job)[0] for job in jobs]
+        if not jobs:
+            return []
+        
+        try:
+            sub_scores = np.array(
+                [
+                    [
+                        self._calculate_skills_match(resume_data, job),
+                        self._calculate_experience_match(resume_data, job),
+                        self._calculate_education_match(resume_data, job),
+                        self._calculate_language_match(resume_data, job),
+                        self._calculate_location_match(resume_data, job),
+                        self._calculate_overqualification_penalty(resume_data, job),
+                    ]
+                    for job in jobs
+                ],
+                dtype=np.float64,
+            )
+            total_score = self._weighted_total(*sub_scores.T)
+            
+            scores: List[int] = np.clip(np.trunc(total_score), 0, 100).astype(int).tolist()
+            return scores
+            
+        except Exception as e:
+            logger.error("Error calculating batch compatibility scores: %s", e)
+            return [0] * len(jobs)
+
+    def _weighted_total(
+        self,
+        skills_score: Any,
+        experience_score: Any,
+        education_score: Any,
+        language_score: Any,
+        location_score: Any,
+        overqualification_penalty: Any,
+    ) -> Any:
+        """Combine sub-scores, given as floats or per-job arrays, into the weighted total."""
+        return (
+            skills_score * self.weights["skills_match"] +
+            experience_score * self.weights["experience_match"] +
+            education_score * self.weights["education_match"] +
+            language_score * self.weights["language_match"] +
+            location_score * self.weights["location_match"]
+        ) - (overqualification_penalty * self.weights["overqualification_penalty"])
+
     def _calculate_skills_match(
         self, resume_data: ResumeData, job_requirements: JobRequirements
     ) -> float:
@@ -89,34 +226,22 @@ class CompatibilityScorer:
         if not job_requirements.required_skills:
             return 50.0  # No requirements specified
         
-        resume_skills_lower = [skill.lower() for skill in resume_data.skills]
         required_skills_lower = [skill.lower() for skill in job_requirements.required_skills]
         preferred_skills_lower = [skill.lower() for skill in job_requirements.preferred_skills]
         
-        # Check required skills match
-        required_matches = sum(
-            1 for skill in required_skills_lower 
-            if any(skill in resume_skill for resume_skill in resume_skills_lower)
-        )
-        
-        # Check preferred skills match
-        preferred_matches = sum(
-            1 for skill in preferred_skills_lower 
-            if any(skill in resume_skill for resume_skill in resume_skills_lower)
+        # Check required and preferred skills match
+        required_matches, preferred_matches = _count_matches(
+            resume_data.skills_lower, required_skills_lower, preferred_skills_lower
         )
         
         # Calculate score
-        if required_skills_lower:
-            required_score = (required_matches / len(required_skills_lower)) * 70
-        else:
-            required_score = 70
-        
+        required_score = (required_matches / len(required_skills_lower)) * 70
         if preferred_skills_lower:
             preferred_score = (preferred_matches / len(preferred_skills_lower)) * 30
         else:
-            preferred_score = 30
+            preferred_score = 30.0
         
-        return min(100, required_score + preferred_score)
+        return min(100.0, required_score + preferred_score)
 
     def _calculate_experience_match(
         self, resume_data: ResumeData, job_requirements: JobRequirements
@@ -190,9 +315,7 @@ class CompatibilityScorer:
         
         # Academic background penalty for non-academic roles
         if resume_data.academic_background:
-            if job_requirements.industry and job_requirements.industry.lower() not in [
-                "technology", "research", "consulting", "education"
-            ]:
+            if self._is_non_academic_industry(job_requirements):
                 penalty += 15.0
         
         # Experience overqualification
@@ -202,6 +325,13 @@ class CompatibilityScorer:
         
         return min(50.0, penalty)  # Cap penalty at 50%
 
+    def _is_non_academic_industry(self, job_requirements: JobRequirements) -> bool:
+        """Check whether the job's industry is one that values academia less."""
+        industry = job_requirements.industry
+        if not industry:
+            return False
+        return industry.lower() not in _ACADEMIC_FRIENDLY_INDUSTRIES
+
     def _calculate_language_match(
         self, resume_data: ResumeData, job_requirements: JobRequirements
     ) -> float:
@@ -209,13 +339,11 @@ class CompatibilityScorer:
         if not job_requirements.languages:
             return 80.0  # No specific language requirements
         
-        resume_languages_lower = [lang.lower() for lang in resume_data.languages]
         required_languages_lower = [lang.lower() for lang in job_requirements.languages]
         
-        matches = sum(
-            1 for req_lang in required_languages_lower
-            if any(req_lang in resume_lang for resume_lang in resume_languages_lower)
-        )
+        matches = _count_matches(
+            resume_data.languages_lower, required_languages_lower
+        )[0]
         
         if matches == len(required_languages_lower):
             return 100.0
@@ -231,7 +359,7 @@ class CompatibilityScorer:
         if not job_requirements.location:
             return 80.0  # No specific location requirement
         
-        resume_location = (resume_data.contact_info.get("location") or "").lower()
+        resume_location = resume_data.location_lower
         job_location = job_requirements.location.lower()
         
         if resume_location and job_location:
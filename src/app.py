@@ -1,11 +1,17 @@
 """Main Gradio application for CV Check."""
 
 import os
+import re
+import hashlib
 import logging
-from typing import Optional, Tuple, Dict, Any
+import threading
+from importlib import resources
+from functools import cached_property
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional, Tuple, Dict, Any, Callable, Iterator
 from pathlib import Path
 from datetime import datetime
-import gradio as gr
 
 # Load environment variables from .env file
 try:
@@ -16,64 +22,244 @@ except ImportError:
     # dotenv not available, use environment variables directly
     pass
 
-from parsers.pdf_parser import PDFParser
-from parsers.docx_parser import DocxParser
 from analyzer.resume_analyzer import ResumeAnalyzer
 from analyzer.job_analyzer import JobAnalyzer
 from analyzer.scorer import CompatibilityScorer
 from analyzer.gap_analyzer import GapAnalyzer
-from generator.interview_prep import InterviewPrepGenerator
-from generator.word_generator import WordDocumentGenerator
 from generator.recommendations import RecommendationGenerator
-from utils.openai_client import OpenAIClient
-from utils.helpers import setup_logging, sanitize_text
+from utils.helpers import (
+    setup_logging,
+    sanitize_text,
+    file_fingerprint,
+    has_expected_signature,
+)
 from utils.validation import ContentValidator
 
+if TYPE_CHECKING:
+    # Imported where used, so importing the app stays cheap without the UI
+    import gradio as gr
+    from parsers.pdf_parser import PDFParser
+    from parsers.docx_parser import DocxParser
+    from generator.interview_prep import InterviewPrepGenerator
+    from generator.word_generator import WordDocumentGenerator
+    from utils.openai_client import OpenAIClient
+
 # Set up logging
 setup_logging()
 logger = logging.getLogger(__name__)
 
+# Bounds of the in-memory LRU caches of analysis results and parsed resumes
+_RESULT_CACHE_SIZE = 256
+_PARSE_CACHE_SIZE = 64
+
+# Threads shared by concurrent requests for the independent analysis stages
+_ANALYSIS_WORKERS = 4
+
+# Analyses the Gradio queue runs at once, and requests it holds before refusing
+_QUEUE_CONCURRENCY = os.cpu_count() or 1
+_QUEUE_MAX_SIZE = 32
+
+AnalysisResult = Tuple[int, str, str, str, Optional[str]]
+
+_PARSE_FAILURE: AnalysisResult = (
+    0,
+    "❌ Failed to parse resume. Please check the file format (PDF or DOCX).",
+    "",
+    "",
+    None,
+)
+
+# Supported resume extensions and the lazily built parser handling each
+_PARSER_ATTRS = {
+    ".pdf": "pdf_parser",
+    ".docx": "docx_parser",
+    ".doc": "docx_parser",
+}
+
+# Marker shown next to each recommendation, anything else counts as Low
+_PRIORITY_EMOJI = {"High": "🔴", "Medium": "🟡", "Low": "🟢"}
+
+# Fixed part of the interview preparation used without an OpenAI client.
+# Tuples cannot be changed by a consumer and still serialize as JSON lists.
+_BASIC_COMMON_QUESTIONS = (
+    "Tell me about yourself",
+    "Why are you interested in this position?",
+    "What are your greatest strengths?",
+    "What are your areas for improvement?",
+    "Where do you see yourself in 5 years?",
+    "Why are you leaving your current position?",
+    "What interests you about our company?",
+    "Describe a challenging project you worked on",
+    "How do you handle stress and pressure?",
+    "Do you have any questions for us?",
+)
+_STAR_METHOD = {
+    "situation": "Describe the context or background",
+    "task": "Explain what you needed to accomplish",
+    "action": "Detail the specific actions you took",
+    "result": "Share the outcomes and what you learned",
+}
+_BASIC_QUESTIONS_TO_ASK = (
+    "What does success look like in this role?",
+    "What are the biggest challenges facing the team?",
+    "How would you describe the company culture?",
+    "What opportunities are there for professional development?",
+    "What are the next steps in the interview process?",
+)
+
+# Static interface content, built once at import. The stylesheet ships as
+# package data of utils, since the app itself is a single module.
+_CSS_RESOURCE = ("utils", "static/app.css")
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _load_css(package: str, resource: str) -> str:
+    """
+    Read the interface stylesheet, dropping comments and runs of whitespace.
+
+    Args:
+        package: Package shipping the stylesheet
+        resource: Path of the stylesheet inside the package
+
+    Returns:
+        Compacted CSS, or an empty string if the file cannot be read
+    """
+    try:
+        css = resources.files(package).joinpath(resource).read_text(encoding="utf-8")
+    except OSError as e:
+        logger.warning("Could not load interface stylesheet: %s", e)
+        return ""
+
+    css = _CSS_COMMENT_RE.sub("", css)
+    return _CSS_WHITESPACE_RE.sub(" ", css).strip()
+
+
+_CSS = _load_css(*_CSS_RESOURCE)
+
+_HEADER_HTML = """
+                <div style="text-align: center;">
+                    <h1 style="margin: 0; font-size: 2.5em; font-weight: 700;">
+                        🎯 CV Check Professional
+                    </h1>
+                    <h2 style="margin: 0.5rem 0; font-size: 1.4em; opacity: 0.9; font-weight: 300;">
+                        AI-Powered Resume Analysis for PhD Professionals
+                    </h2>
+                    <p style="margin: 1rem 0 0 0; font-size: 1.1em; opacity: 0.8;">
+                        Transform your academic expertise into industry success
+                    </p>
+                </div>
+                """
+
+_FOOTER_MD = """
+                ### 💡 **How to Get the Best Results**
+                
+                **📎 Resume Tips:**
+                - Upload your most recent, complete resume
+                - Ensure all sections are clearly formatted
+                - Include quantified achievements where possible
+                
+                **📋 Job Description Tips:**
+                - Copy the complete job posting
+                - Include requirements, responsibilities, and company info
+                - Don't forget salary range and benefits if mentioned
+                
+                **🎯 Analysis Features:**
+                - Real-time compatibility scoring (0-100)
+                - Detailed strengths and improvement areas
+                - Actionable recommendations with priority levels
+                - Professional interview preparation guide
+                - ATS optimization suggestions
+                
+                ---
+                *🇫🇷 Specially designed for PhD professionals transitioning to industry roles in France*
+                """
+
 
 class CVCheckApp:
     """Main application class for CV Check."""
 
     def __init__(self) -> None:
         """Initialize the CV Check application."""
-        self.pdf_parser = PDFParser()
-        self.docx_parser = DocxParser()
         self.resume_analyzer = ResumeAnalyzer()
         self.job_analyzer = JobAnalyzer()
         self.scorer = CompatibilityScorer()
         self.gap_analyzer = GapAnalyzer()
         self.recommendation_generator = RecommendationGenerator()
-        self.word_generator = WordDocumentGenerator()
         
         # Initialize validation system
         self.content_validator = ContentValidator()
 
+        # Content-addressed caches, so resubmitting the same resume and job
+        # description skips parsing, analysis and document generation
+        self._result_cache: "OrderedDict[bytes, AnalysisResult]" = OrderedDict()
+        self._parse_cache: "OrderedDict[bytes, str]" = OrderedDict()
+        # Requests run concurrently on the Gradio queue
+        self._cache_lock = threading.Lock()
+
+        # Job analysis runs here while the request thread analyzes the resume
+        self._pool = ThreadPoolExecutor(
+            max_workers=_ANALYSIS_WORKERS, thread_name_prefix="cv-analysis"
+        )
+
+        # Built on first use by create_gradio_interface
+        self._interface: Optional["gr.Blocks"] = None
+
         # Initialize OpenAI client
         self.openai_client = self._initialize_openai_client()
-        if self.openai_client:
-            self.interview_prep_generator: Optional[
-                InterviewPrepGenerator
-            ] = InterviewPrepGenerator(self.openai_client)
-        else:
-            self.interview_prep_generator = None
-
-    def _initialize_openai_client(self) -> Optional[OpenAIClient]:
+
+    # Parsers and generators are built on first use, so startup does not pay
+    # for PyPDF2 and python-docx, and a DOCX upload never loads the PDF stack
+
+    @cached_property
+    def pdf_parser(self) -> "PDFParser":
+        """PDF parser, imported on the first PDF upload."""
+        from parsers.pdf_parser import PDFParser
+
+        return PDFParser()
+
+    @cached_property
+    def docx_parser(self) -> "DocxParser":
+        """DOCX parser, imported on the first DOCX upload."""
+        from parsers.docx_parser import DocxParser
+
+        return DocxParser()
+
+    @cached_property
+    def word_generator(self) -> "WordDocumentGenerator":
+        """Word report generator, imported with the first report."""
+        from generator.word_generator import WordDocumentGenerator
+
+        return WordDocumentGenerator()
+
+    @cached_property
+    def interview_prep_generator(self) -> Optional["InterviewPrepGenerator"]:
+        """Interview preparation generator, None without an OpenAI client."""
+        if not self.openai_client:
+            return None
+        from generator.interview_prep import InterviewPrepGenerator
+
+        return InterviewPrepGenerator(self.openai_client)
+
+    def _initialize_openai_client(self) -> Optional["OpenAIClient"]:
         """Initialize OpenAI client with API key."""
+        from utils.openai_client import get_openai_client
+
         try:
-            return OpenAIClient()
+            return get_openai_client()
         except ValueError as e:
             logger.error(f"OpenAI client initialization failed: {str(e)}")
             return None
 
-    def parse_resume(self, file_path: Optional[str]) -> Optional[str]:
+    def parse_resume(
+        self, file_path: Optional[str], fingerprint: Optional[bytes] = None
+    ) -> Optional[str]:
         """
         Parse resume file and extract text.
 
         Args:
             file_path: Path to the uploaded resume file
+            fingerprint: Content digest of the file, if already computed
 
         Returns:
             Extracted text or None if parsing fails
@@ -83,79 +269,155 @@ class CVCheckApp:
 
         try:
             file_ext = Path(file_path).suffix.lower()
-
-            if file_ext == ".pdf":
-                result = self.pdf_parser.parse(file_path)
-                return result if isinstance(result, str) else None
-            if file_ext in [".docx", ".doc"]:
-                result = self.docx_parser.parse(file_path)
-                return result if isinstance(result, str) else None
-
-            logger.error(f"Unsupported file format: {file_ext}")
-            return None
+            parser_attr = _PARSER_ATTRS.get(file_ext)
+            if parser_attr is None:
+                logger.error("Unsupported file format: %s", file_ext)
+                return None
+
+            if fingerprint is None:
+                fingerprint = file_fingerprint(file_path)
+            # The extension picks the parser, so it is part of the key
+            cache_key = fingerprint + file_ext.encode()
+            with self._cache_lock:
+                cached = self._parse_cache.get(cache_key)
+                if cached is not None:
+                    self._parse_cache.move_to_end(cache_key)
+                    return cached
+
+            # Fail fast on renamed or corrupt uploads instead of in the parser
+            result = None
+            if has_expected_signature(file_path, file_ext):
+                result = getattr(self, parser_attr).parse(file_path)
+            else:
+                logger.error("File content does not match its %s extension", file_ext)
+            if not isinstance(result, str):
+                return None
+            with self._cache_lock:
+                self._parse_cache[cache_key] = result
+                if len(self._parse_cache) > _PARSE_CACHE_SIZE:
+                    self._parse_cache.popitem(last=False)
+            return result
 
         except Exception as e:
             logger.error(f"Error parsing resume: {str(e)}")
             return None
 
     def analyze_resume_job_match(
-        self, resume_file: Optional[str], job_description: str
-    ) -> Tuple[int, str, str, str, Optional[str]]:
+        self,
+        resume_file: Optional[str],
+        job_description: str,
+        progress: Optional[Callable[[float, str], Any]] = None,
+    ) -> AnalysisResult:
         """
         Analyze resume against job description and return results.
 
         Args:
             resume_file: Path to uploaded resume file
             job_description: Job description text
+            progress: Optional callback receiving (fraction done, stage description)
 
         Returns:
             Tuple of (score, strong_points, weak_points, improvements, interview_prep_file)
         """
+        result: AnalysisResult = (0, "❌ Analysis failed.", "", "", None)
+        for result in self.iter_analysis(resume_file, job_description, progress):
+            pass
+        return result
+
+    def iter_analysis(
+        self,
+        resume_file: Optional[str],
+        job_description: str,
+        progress: Optional[Callable[[float, str], Any]] = None,
+    ) -> Iterator[AnalysisResult]:
+        """
+        Analyze resume against job description, yielding results as they are ready.
+
+        The text results are yielded first without a report file, so they can
+        be shown while the report document is generated. Cached results and
+        failures are yielded once.
+
+        Args:
+            resume_file: Path to uploaded resume file
+            job_description: Job description text
+            progress: Optional callback receiving (fraction done, stage description)
+
+        Yields:
+            Tuple of (score, strong_points, weak_points, improvements, interview_prep_file)
+        """
         try:
             # Basic input validation
             if not resume_file or not job_description.strip():
-                return (
+                yield (
                     0,
                     "❌ Please upload a resume and provide a job description.",
                     "",
                     "",
                     None,
                 )
+                return
+
+            # The job description needs no parsing, reject a bad one before the resume
+            is_valid, validation_error = self.content_validator.validate_job_input(
+                job_description
+            )
+            if not is_valid:
+                yield self._validation_failure(validation_error)
+                return
+
+            # Identical resume and job description reuse the previous result.
+            # The key uses the sanitized text, so descriptions that sanitize
+            # to the same text share one entry.
+            job_description = sanitize_text(job_description)
+            try:
+                fingerprint = file_fingerprint(resume_file)
+            except OSError as e:
+                logger.error("Could not read resume: %s", e)
+                yield _PARSE_FAILURE
+                return
+            result_key = hashlib.blake2b(
+                fingerprint + b"\x00" + job_description.encode("utf-8"),
+                digest_size=16,
+            ).digest()
+            cached = self._cached_result(result_key)
+            if cached is not None:
+                yield cached
+                return
+
+            # The job description was already validated, so analyze it on the
+            # pool while the request thread parses and validates the resume
+            job_future = self._pool.submit(self.job_analyzer.analyze, job_description)
 
             # Parse resume
-            resume_text = self.parse_resume(resume_file)
+            if progress:
+                progress(0.1, "Parsing resume...")
+            resume_text = self.parse_resume(resume_file, fingerprint)
             if not resume_text:
-                return (
-                    0,
-                    "❌ Failed to parse resume. Please check the file format (PDF or DOCX).",
-                    "",
-                    "",
-                    None,
-                )
+                yield _PARSE_FAILURE
+                return
 
             # Advanced content validation with security guardrails
-            is_valid, validation_error = self.content_validator.validate_inputs(
-                resume_text, job_description
+            if progress:
+                progress(0.3, "Validating content...")
+            is_valid, validation_error = self.content_validator.validate_resume_input(
+                resume_text
             )
             
             if not is_valid:
-                return (
-                    0,
-                    f"❌ {validation_error}",
-                    "## 🔒 Content Validation Failed\n\nPlease ensure you're providing legitimate resume and job description content.",
-                    "## 📝 How to Fix\n\n**For Resume:**\n- Include personal information (name, email, phone)\n- Add education section\n- Include work experience\n- List relevant skills\n\n**For Job Description:**\n- Include job title and role details\n- Add company information\n- List requirements and qualifications\n- Include responsibilities",
-                    None,
-                )
+                yield self._validation_failure(validation_error)
+                return
 
             # Sanitize inputs (already done in validator, but keep for extra safety)
             resume_text = sanitize_text(resume_text)
-            job_description = sanitize_text(job_description)
 
-            # Analyze resume and job
+            if progress:
+                progress(0.4, "Analyzing resume and job description...")
             resume_data = self.resume_analyzer.analyze(resume_text)
-            job_requirements = self.job_analyzer.analyze(job_description)
+            job_requirements = job_future.result()
 
             # Calculate compatibility score
+            if progress:
+                progress(0.6, "Scoring compatibility...")
             score, score_breakdown = self.scorer.calculate_score(
                 resume_data, job_requirements
             )
@@ -177,77 +439,120 @@ class CVCheckApp:
             weak_points_text = self._format_weak_points(weak_points)
             improvements_text = self._format_improvements(detailed_recommendations)
 
+            # Show the text results while the report is generated
+            yield (score, strong_points_text, weak_points_text, improvements_text, None)
+
             # Always generate a comprehensive results document
+            if progress:
+                progress(0.8, "Generating analysis report...")
             results_file = self._generate_complete_results_document(
                 resume_data, job_requirements, score_breakdown, score,
                 strong_points, weak_points, detailed_recommendations
             )
 
-            return (
+            result = (
                 score,
                 strong_points_text,
                 weak_points_text,
                 improvements_text,
                 results_file,
             )
+            # A failed report is not cached, so the next submission retries it
+            if results_file:
+                with self._cache_lock:
+                    self._result_cache[result_key] = result
+                    if len(self._result_cache) > _RESULT_CACHE_SIZE:
+                        self._result_cache.popitem(last=False)
+            yield result
 
         except Exception as e:
             logger.error(f"Error in analysis: {str(e)}")
-            return (0, f"❌ Analysis failed: {str(e)}", "", "", None)
+            yield (0, f"❌ Analysis failed: {str(e)}", "", "", None)
+
+    @staticmethod
+    def _validation_failure(validation_error: str) -> AnalysisResult:
+        """Build the result shown when the content validation rejects an input."""
+        return (
+            0,
+            f"❌ {validation_error}",
+            "## 🔒 Content Validation Failed\n\nPlease ensure you're providing legitimate resume and job description content.",
+            "## 📝 How to Fix\n\n**For Resume:**\n- Include personal information (name, email, phone)\n- Add education section\n- Include work experience\n- List relevant skills\n\n**For Job Description:**\n- Include job title and role details\n- Add company information\n- List requirements and qualifications\n- Include responsibilities",
+            None,
+        )
+
+    def _cached_result(self, result_key: bytes) -> Optional[AnalysisResult]:
+        """Return a cached analysis whose report is still on disk, if any."""
+        with self._cache_lock:
+            cached = self._result_cache.get(result_key)
+            if cached is None:
+                return None
+
+            results_file = cached[4]
+            if results_file and not os.path.exists(results_file):
+                # The report was cleaned up, run the analysis again
+                del self._result_cache[result_key]
+                return None
+
+            self._result_cache.move_to_end(result_key)
+            return cached
 
     def _format_strong_points(self, strong_points: list) -> str:
         """Format strong points for display."""
         if not strong_points:
             return "No specific strong points identified."
 
-        formatted = "## 🎯 Strong Points\n\n"
+        parts = ["## 🎯 Strong Points\n\n"]
         for i, point in enumerate(strong_points, 1):
-            formatted += f"**{i}. {point.get('point', 'Strong point')}**\n"
-            formatted += f"*{point.get('category', 'General')}*\n\n"
-            formatted += f"{point.get('explanation', '')}\n\n"
+            parts.append(
+                f"**{i}. {point.get('point', 'Strong point')}**\n"
+                f"*{point.get('category', 'General')}*\n\n"
+                f"{point.get('explanation', '')}\n\n"
+            )
             if point.get("leverage"):
-                formatted += f"💡 **How to leverage:** {point['leverage']}\n\n"
-            formatted += "---\n\n"
+                parts.append(f"💡 **How to leverage:** {point['leverage']}\n\n")
+            parts.append("---\n\n")
 
-        return formatted
+        return "".join(parts)
 
     def _format_weak_points(self, weak_points: list) -> str:
         """Format weak points for display."""
         if not weak_points:
             return "No significant weak points identified."
 
-        formatted = "## ⚠️ Areas for Improvement\n\n"
+        parts = ["## ⚠️ Areas for Improvement\n\n"]
         for i, point in enumerate(weak_points, 1):
-            formatted += f"**{i}. {point.get('point', 'Improvement area')}**\n"
-            formatted += f"*{point.get('category', 'General')}*\n\n"
-            formatted += f"{point.get('explanation', '')}\n\n"
+            parts.append(
+                f"**{i}. {point.get('point', 'Improvement area')}**\n"
+                f"*{point.get('category', 'General')}*\n\n"
+                f"{point.get('explanation', '')}\n\n"
+            )
             if point.get("impact"):
-                formatted += f"📊 **Impact:** {point['impact']}\n\n"
-            formatted += "---\n\n"
+                parts.append(f"📊 **Impact:** {point['impact']}\n\n")
+            parts.append("---\n\n")
 
-        return formatted
+        return "".join(parts)
 
     def _format_improvements(self, improvements: list) -> str:
         """Format improvement recommendations for display."""
         if not improvements:
             return "No specific improvements recommended."
 
-        formatted = "## 🚀 Specific Recommendations\n\n"
+        parts = ["## 🚀 Specific Recommendations\n\n"]
         for i, rec in enumerate(improvements, 1):
             priority = rec.get("priority", "Medium")
-            priority_emoji = (
-                "🔴" if priority == "High" else "🟡" if priority == "Medium" else "🟢"
-            )
+            priority_emoji = _PRIORITY_EMOJI.get(priority, "🟢")
 
-            formatted += f"**{i}. {rec.get('recommendation', 'Recommendation')}** {priority_emoji}\n"
-            formatted += f"*{rec.get('category', 'General')} - {priority} Priority*\n\n"
-            formatted += f"**Action:** {rec.get('action', '')}\n\n"
-            formatted += f"**Impact:** {rec.get('impact', '')}\n\n"
+            parts.append(
+                f"**{i}. {rec.get('recommendation', 'Recommendation')}** {priority_emoji}\n"
+                f"*{rec.get('category', 'General')} - {priority} Priority*\n\n"
+                f"**Action:** {rec.get('action', '')}\n\n"
+                f"**Impact:** {rec.get('impact', '')}\n\n"
+            )
             if rec.get("implementation"):
-                formatted += f"**Implementation:** {rec['implementation']}\n\n"
-            formatted += "---\n\n"
+                parts.append(f"**Implementation:** {rec['implementation']}\n\n")
+            parts.append("---\n\n")
 
-        return formatted
+        return "".join(parts)
 
     def _generate_complete_results_document(
         self,
@@ -328,301 +633,26 @@ class CVCheckApp:
                 "mission": "Understand their mission, values, and recent developments",
                 "industry": f"Learn about the {job_requirements.industry or 'industry'} trends",
             },
-            "common_questions": [
-                "Tell me about yourself",
-                "Why are you interested in this position?",
-                "What are your greatest strengths?",
-                "What are your areas for improvement?",
-                "Where do you see yourself in 5 years?",
-                "Why are you leaving your current position?",
-                "What interests you about our company?",
-                "Describe a challenging project you worked on",
-                "How do you handle stress and pressure?",
-                "Do you have any questions for us?",
-            ],
-            "star_method": {
-                "situation": "Describe the context or background",
-                "task": "Explain what you needed to accomplish",
-                "action": "Detail the specific actions you took",
-                "result": "Share the outcomes and what you learned",
-            },
-            "questions_to_ask": [
-                "What does success look like in this role?",
-                "What are the biggest challenges facing the team?",
-                "How would you describe the company culture?",
-                "What opportunities are there for professional development?",
-                "What are the next steps in the interview process?",
-            ],
+            "common_questions": _BASIC_COMMON_QUESTIONS,
+            "star_method": dict(_STAR_METHOD),
+            "questions_to_ask": _BASIC_QUESTIONS_TO_ASK,
             "based_on_analysis": {
                 "leverage_strengths": [point.get("point", "") for point in strong_points[:3]],
                 "address_concerns": [point.get("point", "") for point in weak_points[:3]],
             },
         }
 
-    def create_gradio_interface(self) -> gr.Blocks:
+    def create_gradio_interface(self) -> "gr.Blocks":
         """Create and configure a professional Gradio interface."""
+        if self._interface is not None:
+            return self._interface
 
-        # Professional modern color scheme - Navy, Teal, and Warm Grays
-        css = """
-        /* Main container styling */
-        .gradio-container {
-            max-width: 1400px !important;
-            margin: 0 auto !important;
-            font-family: 'Inter', 'Segoe UI', system-ui, sans-serif !important;
-            background: linear-gradient(135deg, #f8fafc 0%, #f1f5f9 100%) !important;
-        }
-        
-        /* Header styling - Professional Navy gradient */
-        .header-container {
-            background: linear-gradient(135deg, #0f172a 0%, #1e293b 50%, #334155 100%) !important;
-            color: white !important;
-            padding: 2.5rem !important;
-            border-radius: 16px !important;
-            margin-bottom: 2rem !important;
-            text-align: center !important;
-            box-shadow: 0 10px 40px rgba(15, 23, 42, 0.3) !important;
-            border: 1px solid #475569 !important;
-        }
-        
-        /* Score display styling - Teal theme */
-        .score-container {
-            background: linear-gradient(135deg, #0d9488 0%, #14b8a6 100%) !important;
-            color: white !important;
-            padding: 2rem !important;
-            border-radius: 16px !important;
-            text-align: center !important;
-            margin: 1.5rem 0 !important;
-            box-shadow: 0 8px 25px rgba(13, 148, 136, 0.25) !important;
-            border: 1px solid #5eead4 !important;
-        }
-        
-        .score-display {
-            font-size: 3.2em !important;
-            font-weight: 700 !important;
-            margin: 0 !important;
-            color: white !important;
-            text-shadow: 0 2px 4px rgba(0, 0, 0, 0.3) !important;
-        }
-        
-        .score-label {
-            font-size: 1.3em !important;
-            opacity: 0.95 !important;
-            margin-bottom: 0.8rem !important;
-            color: white !important;
-            font-weight: 500 !important;
-        }
-        
-        /* Input section styling - Warm gray background */
-        .input-section {
-            background: linear-gradient(135deg, #ffffff 0%, #f9fafb 100%) !important;
-            padding: 2rem !important;
-            border-radius: 16px !important;
-            border: 2px solid #e5e7eb !important;
-            margin-bottom: 1.5rem !important;
-            box-shadow: 0 4px 15px rgba(0, 0, 0, 0.05) !important;
-        }
-        
-        /* Button styling - Teal theme */
-        .analyze-button {
-            background: linear-gradient(135deg, #0f766e 0%, #14b8a6 100%) !important;
-            border: none !important;
-            border-radius: 12px !important;
-            padding: 1.2rem 2rem !important;
-            font-size: 1.1em !important;
-            font-weight: 600 !important;
-            color: white !important;
-            cursor: pointer !important;
-            transition: all 0.3s ease !important;
-            box-shadow: 0 6px 20px rgba(15, 118, 110, 0.3) !important;
-            width: 100% !important;
-            margin-top: 1.5rem !important;
-            text-transform: uppercase !important;
-            letter-spacing: 0.5px !important;
-        }
-        
-        .analyze-button:hover {
-            background: linear-gradient(135deg, #134e4a 0%, #0f766e 100%) !important;
-            transform: translateY(-3px) !important;
-            box-shadow: 0 8px 25px rgba(15, 118, 110, 0.4) !important;
-        }
-        
-        /* Tab styling - High contrast */
-        .tab-nav {
-            background: #f1f5f9 !important;
-            border-radius: 8px !important;
-            padding: 0.5rem !important;
-            margin-bottom: 1rem !important;
-            border: 1px solid #cbd5e1 !important;
-        }
-        
-        /* Result sections - Professional styling */
-        .result-section {
-            background: linear-gradient(135deg, #ffffff 0%, #fefefe 100%) !important;
-            border-radius: 16px !important;
-            padding: 2.5rem !important;
-            margin: 1.5rem 0 !important;
-            box-shadow: 0 6px 25px rgba(0, 0, 0, 0.08) !important;
-            border: 2px solid #f3f4f6 !important;
-            border-left: 6px solid #0d9488 !important;
-        }
-        
-        /* Analysis cards with modern styling */
-        .analysis-card {
-            background: linear-gradient(135deg, #ffffff 0%, #fafafa 100%) !important;
-            border-radius: 12px !important;
-            padding: 1.8rem !important;
-            margin: 1.2rem 0 !important;
-            box-shadow: 0 3px 12px rgba(0, 0, 0, 0.08) !important;
-            border: 2px solid #f3f4f6 !important;
-            transition: all 0.3s ease !important;
-            color: #1f2937 !important;
-        }
-        
-        .analysis-card:hover {
-            transform: translateY(-3px) !important;
-            box-shadow: 0 6px 20px rgba(0, 0, 0, 0.12) !important;
-            border-color: #14b8a6 !important;
-            background: linear-gradient(135deg, #ffffff 0%, #f0fdfa 100%) !important;
-        }
-        
-        /* Enhanced text contrast for analysis content */
-        .analysis-card h1, .analysis-card h2, .analysis-card h3, 
-        .analysis-card h4, .analysis-card h5, .analysis-card h6 {
-            color: #000000 !important;
-            font-weight: bold !important;
-        }
-        
-        .analysis-card p, .analysis-card li, .analysis-card span {
-            color: #1f2937 !important;
-            line-height: 1.6 !important;
-        }
-        
-        .analysis-card strong, .analysis-card b {
-            color: #000000 !important;
-            font-weight: bold !important;
-        }
-        
-        /* Download section - Teal theme */
-        .download-section {
-            background: linear-gradient(135deg, #ecfdf5 0%, #d1fae5 100%) !important;
-            padding: 2rem !important;
-            border-radius: 16px !important;
-            text-align: center !important;
-            margin: 2.5rem 0 !important;
-            box-shadow: 0 8px 25px rgba(13, 148, 136, 0.15) !important;
-            border: 2px solid #a7f3d0 !important;
-            color: #0f766e !important;
-        }
-        
-        /* Footer styling - Dark navy */
-        .footer-section {
-            background: linear-gradient(135deg, #0f172a 0%, #1e293b 100%) !important;
-            color: #e2e8f0 !important;
-            padding: 2.5rem !important;
-            border-radius: 16px !important;
-            margin-top: 3rem !important;
-            border: 1px solid #334155 !important;
-            box-shadow: 0 8px 25px rgba(15, 23, 42, 0.3) !important;
-        }
-        
-        /* Progress indicator - Blue theme */
-        .progress-container {
-            background: #e2e8f0 !important;
-            border-radius: 10px !important;
-            height: 8px !important;
-            margin: 1rem 0 !important;
-            overflow: hidden !important;
-        }
-        
-        /* Loading animation - Blue theme */
-        .loading {
-            border: 3px solid #e2e8f0 !important;
-            border-top: 3px solid #3b82f6 !important;
-            border-radius: 50% !important;
-            width: 30px !important;
-            height: 30px !important;
-            animation: spin 1s linear infinite !important;
-            margin: 1rem auto !important;
-        }
-        
-        @keyframes spin {
-            0% { transform: rotate(0deg); }
-            100% { transform: rotate(360deg); }
-        }
-        
-        /* Tab content styling for better contrast */
-        .tab-content {
-            background: white !important;
-            color: #000000 !important;
-            padding: 1rem !important;
-            border-radius: 8px !important;
-            border: 1px solid #e2e8f0 !important;
-        }
-        
-        /* Ensure all text in tabs is high contrast */
-        .tab-content h1, .tab-content h2, .tab-content h3, 
-        .tab-content h4, .tab-content h5, .tab-content h6 {
-            color: #000000 !important;
-            font-weight: bold !important;
-        }
-        
-        .tab-content p, .tab-content li, .tab-content div {
-            color: #1f2937 !important;
-            line-height: 1.6 !important;
-        }
-        
-        .tab-content strong, .tab-content b {
-            color: #000000 !important;
-            font-weight: bold !important;
-        }
-        
-        /* Override Gradio's default bright colors */
-        .gradio-container .prose {
-            color: #000000 !important;
-        }
-        
-        .gradio-container .prose h1, 
-        .gradio-container .prose h2, 
-        .gradio-container .prose h3 {
-            color: #000000 !important;
-        }
-        
-        .gradio-container .prose p {
-            color: #1f2937 !important;
-        }
-        
-        .gradio-container .prose strong {
-            color: #000000 !important;
-        }
-        
-        /* Responsive design */
-        @media (max-width: 768px) {
-            .gradio-container {
-                max-width: 100% !important;
-                padding: 1rem !important;
-            }
-            
-            .score-display {
-                font-size: 2em !important;
-            }
-            
-            .header-container {
-                padding: 1.5rem !important;
-            }
-            
-            .result-section {
-                padding: 1.5rem !important;
-            }
-            
-            .analysis-card {
-                padding: 1rem !important;
-            }
-        }
-        """
+        import gradio as gr
 
         with gr.Blocks(
-            css=css, 
+            css=_CSS, 
             title="CV Check - Professional Resume Analysis",
+            analytics_enabled=False,  # No telemetry requests at startup
             theme=gr.themes.Monochrome(
                 primary_hue="blue",
                 secondary_hue="blue", 
@@ -633,19 +663,7 @@ class CVCheckApp:
             
             # Professional Header
             with gr.Row(elem_classes=["header-container"]):
-                gr.HTML("""
-                <div style="text-align: center;">
-                    <h1 style="margin: 0; font-size: 2.5em; font-weight: 700;">
-                        🎯 CV Check Professional
-                    </h1>
-                    <h2 style="margin: 0.5rem 0; font-size: 1.4em; opacity: 0.9; font-weight: 300;">
-                        AI-Powered Resume Analysis for PhD Professionals
-                    </h2>
-                    <p style="margin: 1rem 0 0 0; font-size: 1.1em; opacity: 0.8;">
-                        Transform your academic expertise into industry success
-                    </p>
-                </div>
-                """)
+                gr.HTML(_HEADER_HTML)
             
             # Main content area
             with gr.Row(equal_height=False):
@@ -657,7 +675,7 @@ class CVCheckApp:
                         gr.Markdown("*Supported formats: PDF, DOCX, DOC*")
                         resume_file = gr.File(
                             label="📎 Upload Your Resume",
-                            file_types=[".pdf", ".docx", ".doc"],
+                            file_types=list(_PARSER_ATTRS),
                             type="filepath"
                         )
                         
@@ -738,35 +756,13 @@ class CVCheckApp:
             
             # Professional footer
             with gr.Group(elem_classes=["footer-section"]):
-                gr.Markdown("""
-                ### 💡 **How to Get the Best Results**
-                
-                **📎 Resume Tips:**
-                - Upload your most recent, complete resume
-                - Ensure all sections are clearly formatted
-                - Include quantified achievements where possible
-                
-                **📋 Job Description Tips:**
-                - Copy the complete job posting
-                - Include requirements, responsibilities, and company info
-                - Don't forget salary range and benefits if mentioned
-                
-                **🎯 Analysis Features:**
-                - Real-time compatibility scoring (0-100)
-                - Detailed strengths and improvement areas
-                - Actionable recommendations with priority levels
-                - Professional interview preparation guide
-                - ATS optimization suggestions
-                
-                ---
-                *🇫🇷 Specially designed for PhD professionals transitioning to industry roles in France*
-                """)
+                gr.Markdown(_FOOTER_MD)
             
             # Enhanced analysis function with UI updates
-            def enhanced_analysis(resume, job_desc):
+            def enhanced_analysis(resume, job_desc, progress=gr.Progress()):
                 """Enhanced analysis with proper UI state management."""
                 if not resume or not job_desc or not job_desc.strip():
-                    return [
+                    yield [
                         gr.update(visible=False),  # score_section
                         gr.update(value="--"),      # score_display  
                         gr.update(visible=False),  # results_section
@@ -778,26 +774,28 @@ class CVCheckApp:
                         None,  # file
                         gr.update(visible=False)   # progress
                     ]
+                    return
                 
-                # Run the analysis
-                score, strong, weak, improvements, file_path = self.analyze_resume_job_match(resume, job_desc)
-                
-                # Format score display
-                score_html = f"""<div class="score-display">{score}/100</div>"""
-                score_breakdown = f"**Overall Score: {score}/100**\n\nThis score reflects the compatibility between your resume and the job requirements. Detailed breakdown is available in the downloadable analysis report."
-                
-                return [
-                    gr.update(visible=True),   # Show score section
-                    score_html,               # Update score display
-                    gr.update(visible=True),   # Show results section
-                    strong,                   # Strong points
-                    weak,                     # Weak points
-                    improvements,             # Improvements
-                    score_breakdown,          # Score breakdown
-                    gr.update(visible=True),   # Show download section
-                    file_path,                # File path
-                    gr.update(visible=False)   # Hide progress
-                ]
+                # Run the analysis, showing the text results before the report is ready
+                for score, strong, weak, improvements, file_path in self.iter_analysis(
+                    resume, job_desc, progress
+                ):
+                    # Format score display
+                    score_html = f"""<div class="score-display">{score}/100</div>"""
+                    score_breakdown = f"**Overall Score: {score}/100**\n\nThis score reflects the compatibility between your resume and the job requirements. Detailed breakdown is available in the downloadable analysis report."
+                    
+                    yield [
+                        gr.update(visible=True),   # Show score section
+                        score_html,               # Update score display
+                        gr.update(visible=True),   # Show results section
+                        strong,                   # Strong points
+                        weak,                     # Weak points
+                        improvements,             # Improvements
+                        score_breakdown,          # Score breakdown
+                        gr.update(visible=file_path is not None),  # Download section once ready
+                        file_path,                # File path
+                        gr.update(visible=False)   # Hide progress
+                    ]
             
             def clear_all():
                 """Clear all inputs and outputs."""
@@ -824,7 +822,9 @@ class CVCheckApp:
                     score_section, score_display, results_section,
                     strong_points_output, weak_points_output, improvements_output, score_breakdown_output,
                     download_section, interview_prep_file, progress_html
-                ]
+                ],
+                concurrency_id="analyze",
+                concurrency_limit=_QUEUE_CONCURRENCY,
             )
             
             # Clear button functionality
@@ -837,6 +837,15 @@ class CVCheckApp:
                 ]
             )
 
+        # Queue requests so several analyses run at once instead of one by one
+        # Closing the REST routes stops direct API calls from skipping the queue
+        interface.queue(
+            default_concurrency_limit=_QUEUE_CONCURRENCY,
+            max_size=_QUEUE_MAX_SIZE,
+            api_open=False,
+        )
+
+        self._interface = interface
         return interface
 
 
@@ -858,11 +867,14 @@ def main() -> None:
         print("📊 AI-powered resume optimization for PhD holders")
         print("🌐 Gradio will show the local URL when ready...")
 
+        # A PORT set by the host is used as is, otherwise Gradio finds a free one
+        port = os.getenv("PORT")
         interface.launch(
             server_name="0.0.0.0",
-            server_port=None,  # Let Gradio find an available port
+            server_port=int(port) if port else None,
             share=False,
             show_error=True,
+            show_api=False,
         )
 
     except Exception as e:
@@ -1,7 +1,19 @@
 """Document generation modules for interview preparation and reports."""
 
+from typing import TYPE_CHECKING
+
+from utils.helpers import lazy_exports
+
 from .interview_prep import InterviewPrepGenerator
-from .word_generator import WordDocumentGenerator
 from .recommendations import RecommendationGenerator
 
-__all__ = ["InterviewPrepGenerator", "WordDocumentGenerator", "RecommendationGenerator"]
\ No newline at end of file
+if TYPE_CHECKING:
+    from .word_generator import WordDocumentGenerator
+
+__all__ = ["InterviewPrepGenerator", "WordDocumentGenerator", "RecommendationGenerator"]
+
+# Module of each class imported on first use. Word reports need
+# python-docx, which is slow to load.
+__getattr__ = lazy_exports(__name__, {
+    "WordDocumentGenerator": ".word_generator",
+})
@@ -1,10 +1,12 @@
 """Interview preparation content generator."""
 
 import logging
-from typing import Dict, List, Any, Optional
+from typing import TYPE_CHECKING, Dict, List, Any, Optional
 from analyzer.resume_analyzer import ResumeData
 from analyzer.job_analyzer import JobRequirements
-from utils.openai_client import OpenAIClient
+
+if TYPE_CHECKING:
+    from utils.openai_client import OpenAIClient
 
 logger = logging.getLogger(__name__)
 
@@ -12,7 +14,7 @@ logger = logging.getLogger(__name__)
 class InterviewPrepGenerator:
     """Generator for creating comprehensive interview preparation content."""
 
-    def __init__(self, openai_client: OpenAIClient) -> None:
+    def __init__(self, openai_client: "OpenAIClient") -> None:
         """
         Initialize the interview prep generator.
         
@@ -1,6 +1,11 @@
 """Word document generator for interview preparation materials."""
 
+import copy
+import hashlib
+import json
 import logging
+import os
+import tempfile
 from typing import Dict, Any, Optional
 from pathlib import Path
 from datetime import datetime
@@ -9,8 +14,19 @@ from docx.shared import Inches, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.style import WD_STYLE_TYPE
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    # orjson not available, report fingerprints use the standard json module
+    _HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
+# Disk space the generated reports may use before the oldest are removed
+_OUTPUT_DIR_BUDGET = 500 * 1024 * 1024
+
 
 class WordDocumentGenerator:
     """Generator for creating Word documents with interview preparation content."""
@@ -19,6 +35,22 @@ class WordDocumentGenerator:
         """Initialize the Word document generator."""
         self.output_dir = Path("outputs")
         self.output_dir.mkdir(exist_ok=True)
+        
+        # Styled blank document, copied for each report instead of re-reading
+        # the default template and adding the custom styles every time
+        self._template = Document()
+        self._setup_document_styles(self._template)
+        
+        # Bytes used by the reports, refreshed by each trim and grown by new
+        # reports, so the directory is only rescanned once over the budget
+        self._output_size = 0
+        
+        # Reports left over from earlier runs count towards the budget
+        self._trim_output_dir()
+
+    def _new_document(self) -> Document:
+        """Return a blank document with the custom styles already set up."""
+        return copy.deepcopy(self._template)
 
     def generate_interview_prep_document(
         self,
@@ -38,11 +70,8 @@ class WordDocumentGenerator:
             Path to generated document or None if generation fails
         """
         try:
-            # Create new document
-            doc = Document()
-            
-            # Set up styles
-            self._setup_document_styles(doc)
+            # Create new document with the custom styles
+            doc = self._new_document()
             
             # Add header
             self._add_document_header(doc, job_title, company_name)
@@ -95,7 +124,7 @@ class WordDocumentGenerator:
             filename = f"{base_name}.docx"
             filepath = self.output_dir / filename
             
-            doc.save(str(filepath))
+            self._save_document(doc, filepath)
             logger.info(f"Interview preparation document saved: {filepath}")
             
             return str(filepath)
@@ -122,11 +151,27 @@ class WordDocumentGenerator:
             Path to generated document or None if generation fails
         """
         try:
-            # Create new document
-            doc = Document()
+            # Identical content maps to the same file, which is then reused
+            fingerprint = self._content_fingerprint(analysis_content, job_title, company_name)
+            truncated_title = job_title[:30] if job_title else "Analysis"
+            safe_job_title = "".join(c for c in truncated_title if c.isalnum() or c in (' ', '-', '_')).rstrip()
+            safe_company = ""
+            if company_name:
+                truncated_company = company_name[:20]
+                safe_company = f"_{truncated_company}"
+                safe_company = "".join(c for c in safe_company if c.isalnum() or c in (' ', '-', '_')).rstrip()
+            
+            filename = f"CV_Analysis_{safe_job_title}{safe_company}_{fingerprint}.docx"
+            filepath = self.output_dir / filename
+            
+            if filepath.exists():
+                # Mark as recently used, so trimming removes other reports first
+                os.utime(filepath)
+                logger.info("Reusing complete analysis document: %s", filepath)
+                return str(filepath)
             
-            # Set up styles
-            self._setup_document_styles(doc)
+            # Create new document with the custom styles
+            doc = self._new_document()
             
             # Add header
             self._add_analysis_header(doc, analysis_content, job_title, company_name)
@@ -153,20 +198,11 @@ class WordDocumentGenerator:
             self._add_document_footer(doc)
             
             # Save document
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            truncated_title = job_title[:30] if job_title else "Analysis"
-            safe_job_title = "".join(c for c in truncated_title if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            safe_company = ""
-            if company_name:
-                truncated_company = company_name[:20]
-                safe_company = f"_{truncated_company}"
-                safe_company = "".join(c for c in safe_company if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            
-            filename = f"CV_Analysis_{safe_job_title}{safe_company}_{timestamp}.docx"
-            filepath = self.output_dir / filename
-            
-            doc.save(str(filepath))
+            self._save_document(doc, filepath)
             logger.info(f"Complete analysis document saved: {filepath}")
+            self._output_size += filepath.stat().st_size
+            if self._output_size > _OUTPUT_DIR_BUDGET:
+                self._trim_output_dir()
             
             return str(filepath)
             
@@ -174,6 +210,80 @@ class WordDocumentGenerator:
             logger.error(f"Error generating complete analysis document: {str(e)}")
             return None
 
+    @staticmethod
+    def _content_fingerprint(
+        analysis_content: Dict[str, Any], job_title: str, company_name: Optional[str]
+    ) -> str:
+        """
+        Compute a digest of the report content, ignoring when it was produced.
+        
+        Args:
+            analysis_content: Complete analysis content dictionary
+            job_title: Job title for the position
+            company_name: Company name if available
+            
+        Returns:
+            Hex digest identifying the report
+        """
+        content = dict(analysis_content)
+        summary = dict(content.get("analysis_summary", {}))
+        summary.pop("analysis_date", None)
+        content["analysis_summary"] = summary
+        payload = [content, job_title, company_name]
+        if _HAS_ORJSON:
+            try:
+                encoded = orjson.dumps(
+                    payload,
+                    default=str,
+                    option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+                )
+                return hashlib.blake2b(encoded, digest_size=8).hexdigest()
+            except orjson.JSONEncodeError:
+                # e.g. integers wider than 64 bits, which json still handles
+                pass
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.blake2b(encoded, digest_size=8).hexdigest()
+
+    def _save_document(self, doc: Document, filepath: Path) -> None:
+        """
+        Save a document so that readers never see a partially written file.
+        
+        The document is written to a temporary file in the output directory
+        and then renamed into place, which is atomic on the same filesystem.
+        
+        Args:
+            doc: Document to save
+            filepath: Final path of the document
+        """
+        fd, temp_name = tempfile.mkstemp(dir=self.output_dir, suffix=".tmp")
+        os.close(fd)
+        try:
+            doc.save(temp_name)
+            os.replace(temp_name, filepath)
+        except BaseException:
+            os.unlink(temp_name)
+            raise
+
+    def _trim_output_dir(self) -> None:
+        """Remove the least recently used reports once they exceed the disk budget."""
+        try:
+            reports = []
+            for path in self.output_dir.glob("*.docx"):
+                stat = path.stat()
+                reports.append((stat.st_mtime, stat.st_size, path))
+            
+            total_size = sum(size for _, size, _ in reports)
+            for _, size, path in sorted(reports, key=lambda report: report[0]):
+                if total_size <= _OUTPUT_DIR_BUDGET:
+                    break
+                path.unlink()
+                total_size -= size
+            
+            self._output_size = total_size
+                
+        except OSError as e:
+            logger.warning("Could not trim output directory: %s", e)
+
     def _setup_document_styles(self, doc: Document) -> None:
         """Set up custom styles for the document."""
         styles = doc.styles
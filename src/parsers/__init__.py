@@ -1,6 +1,18 @@
 """Document parsers for various resume formats."""
 
-from .pdf_parser import PDFParser
-from .docx_parser import DocxParser
+from typing import TYPE_CHECKING
 
-__all__ = ["PDFParser", "DocxParser"]
\ No newline at end of file
+from utils.helpers import lazy_exports
+
+if TYPE_CHECKING:
+    from .pdf_parser import PDFParser
+    from .docx_parser import DocxParser
+
+__all__ = ["PDFParser", "DocxParser"]
+
+# Module of each class imported on first use. An upload in one format
+# never loads the other format's library.
+__getattr__ = lazy_exports(__name__, {
+    "PDFParser": ".pdf_parser",
+    "DocxParser": ".docx_parser",
+})
@@ -1,6 +1,16 @@
 """Utility modules for CV Check application."""
 
-from .openai_client import OpenAIClient
-from .helpers import setup_logging, sanitize_text
+from typing import TYPE_CHECKING
 
-__all__ = ["OpenAIClient", "setup_logging", "sanitize_text"]
\ No newline at end of file
+from .helpers import lazy_exports, setup_logging, sanitize_text
+
+if TYPE_CHECKING:
+    from .openai_client import OpenAIClient
+
+__all__ = ["OpenAIClient", "setup_logging", "sanitize_text"]
+
+# Module of each class imported on first use. The openai package is slow
+# to load and only needed with an API key.
+__getattr__ = lazy_exports(__name__, {
+    "OpenAIClient": ".openai_client",
+})
@@ -1,8 +1,32 @@
 """Helper functions for the CV Check application."""
 
+import hashlib
 import logging
 import re
-from typing import Optional
+from functools import lru_cache
+from importlib import import_module
+from typing import Any, Callable, Dict, Mapping, Optional
+
+# Compiled once, sanitize_text runs on every analysis
+_WHITESPACE_RE = re.compile(r'\s+')
+_DISALLOWED_CHARS_RE = re.compile(r'[^\w\s\-.,;:!?()@#%&*+=/\[\]{}|\\~`"\'<>]')
+_REPEATED_PUNCTUATION_RE = re.compile(r'([.,;:!?]){2,}')
+
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
+# French phone number patterns
+_PHONE_RES = (
+    re.compile(r'\+33\s?[1-9](?:[\s.-]?\d{2}){4}'),  # +33 format
+    re.compile(r'0[1-9](?:[\s.-]?\d{2}){4}'),        # 0X format
+    re.compile(r'\d{10}'),                           # 10 digits
+)
+
+# Leading bytes of each supported resume format, .doc uploads must be Word 2007+
+_FILE_SIGNATURES = {
+    ".pdf": b"%PDF-",
+    ".docx": b"PK\x03\x04",
+    ".doc": b"PK\x03\x04",
+}
 
 
 def setup_logging(level: str = "INFO") -> None:
@@ -22,6 +46,8 @@ def setup_logging(level: str = "INFO") -> None:
     )
 
 
+# Parse-cache hits hand back the same resume text, which then skips the regex passes
+@lru_cache(maxsize=64)
 def sanitize_text(text: str) -> str:
     """
     Clean and sanitize text content.
@@ -36,13 +62,13 @@ def sanitize_text(text: str) -> str:
         return ""
     
     # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RE.sub(' ', text)
     
     # Remove special characters but keep basic punctuation
-    text = re.sub(r'[^\w\s\-.,;:!?()@#%&*+=/\[\]{}|\\~`"\'<>]', '', text)
+    text = _DISALLOWED_CHARS_RE.sub('', text)
     
     # Remove multiple consecutive punctuation marks
-    text = re.sub(r'([.,;:!?]){2,}', r'\1', text)
+    text = _REPEATED_PUNCTUATION_RE.sub(r'\1', text)
     
     return text.strip()
 
@@ -57,8 +83,7 @@ def extract_email(text: str) -> Optional[str]:
     Returns:
         Email address if found, None otherwise
     """
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    match = re.search(email_pattern, text)
+    match = _EMAIL_RE.search(text)
     return match.group() if match else None
 
 
@@ -72,15 +97,8 @@ def extract_phone(text: str) -> Optional[str]:
     Returns:
         Phone number if found, None otherwise
     """
-    # French phone number patterns
-    phone_patterns = [
-        r'\+33\s?[1-9](?:[\s.-]?\d{2}){4}',  # +33 format
-        r'0[1-9](?:[\s.-]?\d{2}){4}',        # 0X format
-        r'\d{10}',                           # 10 digits
-    ]
-    
-    for pattern in phone_patterns:
-        match = re.search(pattern, text)
+    for pattern in _PHONE_RES:
+        match = pattern.search(text)
         if match:
             return match.group()
     
@@ -114,4 +132,98 @@ def truncate_text(text: str, max_length: int = 1000) -> str:
     if len(text) <= max_length:
         return text
     
-    return text[:max_length - 3] + "..."
\ No newline at end of file
+    return text[:max_length - 3] + "..."
+
+
+def file_fingerprint(file_path: str) -> bytes:
+    """
+    Compute a content digest of a file, for caching by file content.
+    
+    Args:
+        file_path: Path to the file
+        
+    Returns:
+        16-byte BLAKE2b digest of the file bytes
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 16), b""):
+            digest.update(block)
+    return digest.digest()
+
+
+def has_expected_signature(file_path: str, extension: str) -> bool:
+    """
+    Check that a file starts like the format its extension names.
+    
+    Readers accept a PDF header anywhere in the first kilobyte, so it is
+    searched for there. Unknown extensions are not checked.
+    
+    Args:
+        file_path: Path to the file
+        extension: File extension, including the leading dot
+        
+    Returns:
+        False if the file content does not match the extension
+    """
+    extension = extension.lower()
+    signature = _FILE_SIGNATURES.get(extension)
+    if signature is None:
+        return True
+    
+    with open(file_path, "rb") as file:
+        head = file.read(1024)
+    if extension == ".pdf":
+        return signature in head
+    return head.startswith(signature)
+
+
+class AnalysisCacheMixin:
+    """
+    Per-instance LRU cache in front of an analyzer's _analyze method.
+    
+    Classes set _analysis_cache_size, define _analyze and call _init_cache
+    from __init__. The cache is dropped when pickling, e.g. for process pool
+    workers, and rebuilt empty when unpickling.
+    """
+
+    _analysis_cache_size = 128
+    _analyze: Callable[[str], Any]
+
+    def _init_cache(self) -> None:
+        """Set up the per-instance cache of analyzed texts."""
+        # Per instance so the cache never outlives or mixes analyzers
+        self._analyze_cached = lru_cache(maxsize=self._analysis_cache_size)(
+            self._analyze
+        )
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Drop the cache when pickling."""
+        state = self.__dict__.copy()
+        del state["_analyze_cached"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the analyzer with a fresh cache."""
+        self.__dict__.update(state)
+        self._init_cache()
+
+
+def lazy_exports(package: str, modules: Mapping[str, str]) -> Callable[[str], Any]:
+    """
+    Build a module __getattr__ importing the given names on first use.
+    
+    Args:
+        package: Name of the package exporting the names, i.e. its __name__
+        modules: Relative module defining each exported name
+        
+    Returns:
+        Function to assign to the package's __getattr__
+    """
+    def __getattr__(name: str) -> Any:
+        """Import the lazily exported names on first use."""
+        if name in modules:
+            return getattr(import_module(modules[name], package), name)
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    return __getattr__
@@ -1,30 +1,121 @@
 """OpenAI client for API interactions."""
 
 import os
+import json
+import hashlib
 import logging
-from typing import Optional, Dict, Any
-from openai import OpenAI
+import tempfile
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Dict, Any, List
+import httpx
+from openai import OpenAI, DefaultHttpxClient
+
+try:
+    import h2
+except ImportError:
+    # h2 not available, API connections use HTTP/1.1
+    h2 = None
 
 logger = logging.getLogger(__name__)
 
+# Directory of the on-disk completion cache; completions are not cached unless set
+_CACHE_DIR_ENV = "CV_CHECK_CACHE_DIR"
+
+# API requests in flight at once per client, so threads sharing a client wait
+# here instead of tripping the account's rate limit into retry backoff
+_MAX_CONCURRENCY_ENV = "OPENAI_MAX_CONCURRENCY"
+_DEFAULT_MAX_CONCURRENCY = 5
+
+# Completions are seconds apart, longer than httpx's 5 s default keep-alive,
+# so idle connections are kept open to spare the next call a TLS handshake
+_CONNECTION_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=60.0
+)
+
+# System messages are kept byte-identical across calls and sent first, so the
+# provider's automatic prompt-prefix cache can reuse them between requests
+_MATCH_SYSTEM_MESSAGE = """You are an expert HR analyst specializing in resume optimization for PhD holders in France. 
+        Your task is to analyze the match between a resume and job description, providing specific, actionable feedback.
+        
+        Focus on:
+        1. PhD overqualification risks
+        2. French job market specifics
+        3. Skills alignment
+        4. Experience level matching
+        5. Keyword optimization
+        
+        Return your analysis in JSON format with these keys:
+        - acceptance_score: integer 0-100
+        - score_reasoning: string explaining the score
+        - strong_points: list of 3-5 strengths with explanations
+        - weak_points: list of 3-5 weaknesses with explanations
+        - improvements: list of specific, actionable recommendations
+        """
+
+_INTERVIEW_PREP_SYSTEM_MESSAGE = """You are an expert interview coach specializing in helping PhD holders in France. 
+        Create comprehensive interview preparation content based on the resume, job description, and analysis results.
+        
+        Include:
+        1. Company and role analysis
+        2. Predicted interview questions (8-10)
+        3. Suggested answers using candidate's experience
+        4. Stories and examples to prepare
+        5. Questions to ask the interviewer
+        6. French market salary insights
+        7. Tips for addressing PhD overqualification concerns
+        """
+
 
 class OpenAIClient:
     """Client for interacting with OpenAI API."""
 
-    def __init__(self, api_key: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> None:
         """
         Initialize OpenAI client.
         
         Args:
             api_key: OpenAI API key. If None, will try to get from environment.
+            cache_dir: Directory where completions are cached. If None, will try
+                to get from the CV_CHECK_CACHE_DIR environment variable.
+            max_concurrency: Maximum API requests in flight at once. If None, will
+                try to get from the OPENAI_MAX_CONCURRENCY environment variable.
         """
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
             raise ValueError("OpenAI API key not provided")
         
-        self.client = OpenAI(api_key=self.api_key)
+        # One pooled HTTP client for the lifetime of the app, shared by every
+        # request thread; the SDK retries connection errors and 429/5xx itself
+        self.client = OpenAI(
+            api_key=self.api_key,
+            http_client=DefaultHttpxClient(
+                http2=h2 is not None, limits=_CONNECTION_LIMITS
+            ),
+        )
         self.model = "gpt-4"
 
+        cache_dir = cache_dir or os.getenv(_CACHE_DIR_ENV)
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+
+        if max_concurrency is None:
+            try:
+                max_concurrency = int(
+                    os.getenv(_MAX_CONCURRENCY_ENV, str(_DEFAULT_MAX_CONCURRENCY))
+                )
+            except ValueError:
+                logger.warning(
+                    "Invalid %s, using %s", _MAX_CONCURRENCY_ENV, _DEFAULT_MAX_CONCURRENCY
+                )
+                max_concurrency = _DEFAULT_MAX_CONCURRENCY
+        self._request_slots = threading.BoundedSemaphore(max(1, max_concurrency))
+
     def generate_completion(
         self,
         prompt: str,
@@ -50,19 +141,96 @@ class OpenAIClient:
                 messages.append({"role": "system", "content": system_message})
             messages.append({"role": "user", "content": prompt})
 
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,  # type: ignore
-                max_tokens=max_tokens,
-                temperature=temperature,
-            )
+            cache_path = self._completion_cache_path(messages, max_tokens, temperature)
+            if cache_path is not None:
+                cached = self._read_cached_completion(cache_path)
+                if cached is not None:
+                    return cached
+
+            # Cache hits above never wait for a request slot
+            with self._request_slots:
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,  # type: ignore
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                )
+            self._log_cache_usage(response)
             
-            return response.choices[0].message.content
+            content = response.choices[0].message.content
+            if cache_path is not None and content is not None:
+                self._write_cached_completion(cache_path, content)
+            return content
             
         except Exception as e:
             logger.error(f"OpenAI API error: {str(e)}")
             return None
 
+    def _completion_cache_path(
+        self, messages: List[Dict[str, str]], max_tokens: int, temperature: float
+    ) -> Optional[Path]:
+        """
+        Locate the cache entry of a request from everything that shapes its reply.
+        
+        Args:
+            messages: Chat messages of the request
+            max_tokens: Maximum number of tokens to generate
+            temperature: Sampling temperature
+            
+        Returns:
+            Path of the cache file, or None when caching is disabled
+        """
+        if self.cache_dir is None:
+            return None
+        
+        request = json.dumps([self.model, messages, max_tokens, temperature])
+        key = hashlib.sha256(request.encode("utf-8")).hexdigest()
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    @staticmethod
+    def _read_cached_completion(cache_path: Path) -> Optional[str]:
+        """Return a cached completion, or None if it is missing or unreadable."""
+        try:
+            with open(cache_path, encoding="utf-8") as file:
+                content = json.load(file)["content"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring unreadable completion cache entry: %s", e)
+            return None
+        
+        logger.debug("Completion served from cache: %s", cache_path.name)
+        return content if isinstance(content, str) else None
+
+    @staticmethod
+    def _write_cached_completion(cache_path: Path, content: str) -> None:
+        """Store a completion, replacing the entry atomically so readers never see half a file."""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as file:
+                    json.dump({"content": content}, file)
+                os.replace(temp_name, cache_path)
+            except BaseException:
+                os.unlink(temp_name)
+                raise
+        except OSError as e:
+            logger.warning("Could not cache completion: %s", e)
+
+    @staticmethod
+    def _log_cache_usage(response: Any) -> None:
+        """Log how many prompt tokens were served from the provider's prefix cache."""
+        usage = getattr(response, "usage", None)
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", None)
+        if isinstance(cached_tokens, int):
+            logger.debug(
+                "Prompt cache: %s of %s prompt tokens cached",
+                cached_tokens,
+                getattr(usage, "prompt_tokens", None),
+            )
+
     def analyze_resume_job_match(
         self, resume_text: str, job_description: str
     ) -> Optional[Dict[str, Any]]:
@@ -76,24 +244,6 @@ class OpenAIClient:
         Returns:
             Analysis results as dictionary or None if analysis fails
         """
-        system_message = """You are an expert HR analyst specializing in resume optimization for PhD holders in France. 
-        Your task is to analyze the match between a resume and job description, providing specific, actionable feedback.
-        
-        Focus on:
-        1. PhD overqualification risks
-        2. French job market specifics
-        3. Skills alignment
-        4. Experience level matching
-        5. Keyword optimization
-        
-        Return your analysis in JSON format with these keys:
-        - acceptance_score: integer 0-100
-        - score_reasoning: string explaining the score
-        - strong_points: list of 3-5 strengths with explanations
-        - weak_points: list of 3-5 weaknesses with explanations
-        - improvements: list of specific, actionable recommendations
-        """
-
         prompt = f"""
         RESUME:
         {resume_text}
@@ -107,14 +257,13 @@ class OpenAIClient:
         try:
             response = self.generate_completion(
                 prompt=prompt,
-                system_message=system_message,
+                system_message=_MATCH_SYSTEM_MESSAGE,
                 max_tokens=3000,
                 temperature=0.3,
             )
             
             if response:
                 # Parse JSON response
-                import json
                 try:
                     return json.loads(response)  # type: ignore
                 except json.JSONDecodeError:
@@ -141,19 +290,6 @@ class OpenAIClient:
         Returns:
             Interview preparation content or None if generation fails
         """
-        system_message = """You are an expert interview coach specializing in helping PhD holders in France. 
-        Create comprehensive interview preparation content based on the resume, job description, and analysis results.
-        
-        Include:
-        1. Company and role analysis
-        2. Predicted interview questions (8-10)
-        3. Suggested answers using candidate's experience
-        4. Stories and examples to prepare
-        5. Questions to ask the interviewer
-        6. French market salary insights
-        7. Tips for addressing PhD overqualification concerns
-        """
-
         prompt = f"""
         RESUME:
         {resume_text}
@@ -170,7 +306,7 @@ class OpenAIClient:
         try:
             response = self.generate_completion(
                 prompt=prompt,
-                system_message=system_message,
+                system_message=_INTERVIEW_PREP_SYSTEM_MESSAGE,
                 max_tokens=4000,
                 temperature=0.5,
             )
@@ -179,4 +315,18 @@ class OpenAIClient:
             
         except Exception as e:
             logger.error(f"Error generating interview prep: {str(e)}")
-            return None
\ No newline at end of file
+            return None
+
+
+@lru_cache(maxsize=1)
+def get_openai_client() -> OpenAIClient:
+    """
+    Return the process-wide OpenAI client, creating it on first use.
+    
+    Every caller shares one connection pool. A missing API key raises on
+    each call, since failures are not cached.
+    
+    Returns:
+        Shared OpenAI client configured from the environment
+    """
+    return OpenAIClient()
@@ -0,0 +1,399 @@
+"""Fast multi-keyword search helpers for the analyzers."""
+
+import re
+import sys
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, cast
+
+try:
+    import ahocorasick
+except ImportError:
+    # pyahocorasick not available, fall back to a combined regex
+    ahocorasick = None
+
+try:
+    import re2
+except ImportError:
+    # google-re2 not available, use the standard library engine
+    re2 = None
+
+# RE2's \w, \d and \s are ASCII only. These classes match what the escapes
+# match in re on str patterns, so accented words and NBSPs behave the same.
+_RE2_CLASSES = {
+    "w": r"\pL\pN_",
+    "d": r"\p{Nd}",
+    "s": r"\s\pZ\x0b\x1c-\x1f\x85",
+}
+
+
+def _is_word_char(char: str) -> bool:
+    """Mirror the regex ``\\w`` class for a single character."""
+    return char.isalnum() or char == "_"
+
+
+def _extends_word(char: str) -> bool:
+    """
+    Check whether a character after a keyword makes it part of a longer word.
+
+    Digits don't, so versioned skills such as "python3" or "html5" still
+    match their keyword. Mirrors the regex ``[^\\W\\d]`` class.
+    """
+    return _is_word_char(char) and not char.isdecimal()
+
+
+def _to_re2_syntax(pattern: str) -> Optional[str]:
+    """
+    Rewrite the Unicode escapes of a pattern into RE2 classes.
+
+    Args:
+        pattern: Regex pattern written for re
+
+    Returns:
+        Equivalent RE2 pattern, or None if the pattern uses an escape RE2
+        cannot match the way re does, such as ``\\b`` or ``\\S`` in a class
+    """
+    translated = []
+    in_class = False
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == "\\" and index + 1 < len(pattern):
+            escaped = pattern[index + 1]
+            unicode_class = _RE2_CLASSES.get(escaped.lower())
+            if escaped in "bB" and not in_class:
+                return None
+            if unicode_class is None:
+                translated.append(char + escaped)
+            elif escaped.islower():
+                translated.append(unicode_class if in_class else f"[{unicode_class}]")
+            elif in_class:
+                # A negated class cannot be merged into an enclosing one
+                return None
+            else:
+                translated.append(f"[^{unicode_class}]")
+            index += 2
+            continue
+        if char == "[" and not in_class:
+            in_class = True
+        elif char == "]" and in_class:
+            in_class = False
+        translated.append(char)
+        index += 1
+    return "".join(translated)
+
+
+def compile_linear(pattern: str) -> "re.Pattern[str]":
+    """
+    Compile a case-sensitive pattern with RE2 when it is installed.
+
+    RE2 runs in linear time, so crafted input cannot trigger catastrophic
+    backtracking. Patterns RE2 cannot express are compiled with re.
+
+    Args:
+        pattern: Regex pattern
+
+    Returns:
+        Compiled pattern with the re.Pattern search API
+    """
+    # RE2 patterns are not re.Pattern instances, but offer the same methods
+    if re2 is not None:
+        translated = _to_re2_syntax(pattern)
+        if translated is not None:
+            try:
+                return cast("re.Pattern[str]", re2.compile(translated))
+            except re2.error:
+                pass
+    return re.compile(pattern)
+
+
+class KeywordMatcher:
+    """Find which keywords of a fixed vocabulary occur in a text.
+
+    The whole vocabulary is scanned in a single pass, using an Aho-Corasick
+    automaton when ``pyahocorasick`` is installed and a combined alternation
+    regex otherwise. Keywords and texts are expected in lowercase.
+    """
+
+    def __init__(self, keywords: Iterable[str], whole_words: bool = True) -> None:
+        """
+        Build the matcher.
+
+        Args:
+            keywords: Vocabulary to search for
+            whole_words: Only report keywords delimited by word boundaries
+        """
+        # Interned, so hits compare by identity in the callers' sets and dicts
+        self.keywords = list(
+            dict.fromkeys(sys.intern(keyword.lower()) for keyword in keywords)
+        )
+        self.whole_words = whole_words
+        self._order = {keyword: index for index, keyword in enumerate(self.keywords)}
+        self._automaton = None
+        self._regex: Optional["re.Pattern[str]"] = None
+        # Shorter keywords that also match wherever a longer one starts
+        self._prefixes: Dict[str, List[str]] = {}
+
+        if ahocorasick is not None and self.keywords:
+            self._automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                self._automaton.add_word(keyword, keyword)
+            self._automaton.make_automaton()
+        elif self.keywords:
+            # Longest first so overlapping keywords prefer the most specific one
+            alternation = "|".join(
+                re.escape(keyword)
+                for keyword in sorted(self.keywords, key=len, reverse=True)
+            )
+            # Lookahead keeps matches overlapping, as the automaton does. Word
+            # boundaries are checked on the matches, so a scan can override them
+            self._regex = re.compile(rf"(?=({alternation}))")
+            self._prefixes = {
+                keyword: [
+                    other
+                    for other in self.keywords
+                    if other != keyword and keyword.startswith(other)
+                ]
+                for keyword in self.keywords
+            }
+
+    def _spans(self, text: str, whole_words: bool) -> Iterator[Tuple[int, str]]:
+        """Yield (start, keyword) for every keyword occurrence in the text."""
+        if self._automaton is not None:
+            last = len(text) - 1
+            for end, keyword in self._automaton.iter(text):
+                start = end - len(keyword) + 1
+                if whole_words:
+                    if start > 0 and _is_word_char(text[start - 1]):
+                        continue
+                    if end < last and _extends_word(text[end + 1]):
+                        continue
+                yield start, keyword
+        elif self._regex is not None:
+            for match in self._regex.finditer(text):
+                start = match.start()
+                if whole_words and start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                keyword = match.group(1)
+                end = start + len(keyword)
+                if not whole_words or end == len(text) or not _extends_word(text[end]):
+                    yield start, keyword
+                # The alternation reports one keyword per position only
+                for prefix in self._prefixes[keyword]:
+                    end = start + len(prefix)
+                    if (
+                        not whole_words
+                        or end == len(text)
+                        or not _extends_word(text[end])
+                    ):
+                        yield start, prefix
+
+    def _hits(self, text: str) -> Iterator[str]:
+        """Yield every keyword occurrence in the text, possibly repeated."""
+        for _, keyword in self._spans(text, self.whole_words):
+            yield keyword
+
+    def finditer(
+        self, text: str, whole_words: Optional[bool] = None
+    ) -> Iterator[Tuple[int, str]]:
+        """
+        Yield every keyword occurrence in the text with its start offset.
+
+        Occurrences are not sorted by start, but never move back to an
+        earlier line of the text.
+
+        Args:
+            text: Lowercased text to scan
+            whole_words: Overrides the matcher's word boundary setting
+
+        Returns:
+            Iterator of (start offset, keyword) pairs
+        """
+        if whole_words is None:
+            whole_words = self.whole_words
+        return self._spans(text, whole_words)
+
+    def find(self, text: str) -> List[str]:
+        """
+        Return the keywords found in the text.
+
+        Args:
+            text: Lowercased text to scan
+
+        Returns:
+            Unique matched keywords, in vocabulary order
+        """
+        if not text:
+            return []
+        return sorted(set(self._hits(text)), key=self._order.__getitem__)
+
+    def contains_any(self, text: str) -> bool:
+        """
+        Check whether any keyword occurs in the text, stopping at the first hit.
+
+        Args:
+            text: Lowercased text to scan
+
+        Returns:
+            True if at least one keyword was found
+        """
+        return bool(text) and next(self._hits(text), None) is not None
+
+
+class KeywordGroups:
+    """Find the keywords of several named vocabularies in one pass.
+
+    Every vocabulary is merged into a single matcher whose hits are bucketed
+    back into their categories, so the text is scanned once however many
+    vocabularies there are. A keyword may belong to several categories.
+    """
+
+    def __init__(
+        self,
+        groups: Dict[str, Iterable[str]],
+        whole_words: Iterable[str] = (),
+    ) -> None:
+        """
+        Build the matcher.
+
+        Args:
+            groups: Vocabulary of each category
+            whole_words: Categories whose keywords must sit on word boundaries
+        """
+        whole_word_categories = set(whole_words)
+        self.categories = list(groups)
+        self._order: Dict[str, Dict[str, int]] = {}
+        # keyword -> [(category, whole_words), ...]
+        self._payloads: Dict[str, List[Tuple[str, bool]]] = {}
+        for category, keywords in groups.items():
+            order = self._order[category] = {}
+            for keyword in keywords:
+                keyword = sys.intern(keyword.lower())
+                if keyword in order:
+                    continue
+                order[keyword] = len(order)
+                self._payloads.setdefault(keyword, []).append(
+                    (category, category in whole_word_categories)
+                )
+        # Boundaries are checked per category, so the scan itself is raw
+        self._matcher = KeywordMatcher(self._payloads, whole_words=False)
+
+    def find(self, text: str) -> Dict[str, List[str]]:
+        """
+        Return the keywords found in the text, per category.
+
+        Args:
+            text: Lowercased text to scan
+
+        Returns:
+            Unique matched keywords of every category, in vocabulary order
+        """
+        found: Dict[str, Set[str]] = {category: set() for category in self.categories}
+        if text:
+            last = len(text) - 1
+            for start, keyword in self._matcher.finditer(text, whole_words=False):
+                end = start + len(keyword) - 1
+                on_boundary = (start == 0 or not _is_word_char(text[start - 1])) and (
+                    end == last or not _extends_word(text[end + 1])
+                )
+                for category, whole in self._payloads[keyword]:
+                    if on_boundary or not whole:
+                        found[category].add(keyword)
+        return {
+            category: sorted(hits, key=self._order[category].__getitem__)
+            for category, hits in found.items()
+        }
+
+
+class PatternFamily:
+    """A prioritised family of regex patterns scanned on lowercased text.
+
+    Case-insensitive matching makes the regex engine fold case at every
+    position it tries. The patterns here are written in lowercase and run
+    case-sensitively against text that was lowercased once, with results
+    mapped back onto the original text so their case is preserved.
+    """
+
+    def __init__(self, *patterns: str) -> None:
+        """
+        Compile the family.
+
+        Args:
+            patterns: Lowercase regex patterns, highest priority first
+        """
+        self.patterns = tuple(re.compile(pattern) for pattern in patterns)
+        # Priority searches stop at the first hit, where RE2 is the faster engine
+        self._search_patterns = tuple(compile_linear(pattern) for pattern in patterns)
+        # Used when lowercasing changed the text length and spans don't line up
+        self._fallback = tuple(
+            re.compile(pattern, re.IGNORECASE) for pattern in patterns
+        )
+
+    def search(
+        self, text: str, text_lower: Optional[str] = None, group: int = 0
+    ) -> Optional[str]:
+        """
+        Return a group of the first pattern, in priority order, that matches.
+
+        Args:
+            text: Original text
+            text_lower: The text lowercased, if already computed
+            group: Group of the match to return
+
+        Returns:
+            Matched group taken from the original text, or None
+        """
+        if text_lower is None:
+            text_lower = text.lower()
+
+        if len(text_lower) != len(text):
+            for pattern in self._fallback:
+                match = pattern.search(text)
+                if match:
+                    return match.group(group)
+            return None
+
+        for pattern in self._search_patterns:
+            match = pattern.search(text_lower)
+            if match:
+                return text[match.start(group) : match.end(group)]
+        return None
+
+    def finditer(self, text: str, text_lower: Optional[str] = None) -> Iterator[str]:
+        """
+        Yield every match of every pattern, in priority order.
+
+        Matches run through the linear-time engine and are taken from the
+        original text, so their case is preserved.
+
+        Args:
+            text: Original text
+            text_lower: The text lowercased, if already computed
+
+        Returns:
+            Iterator of matched substrings of the original text
+        """
+        if text_lower is None:
+            text_lower = text.lower()
+
+        if len(text_lower) != len(text):
+            for pattern in self._fallback:
+                for match in pattern.finditer(text):
+                    yield match.group()
+            return
+
+        for pattern in self._search_patterns:
+            for match in pattern.finditer(text_lower):
+                yield text[match.start() : match.end()]
+
+    def findall(self, text_lower: str) -> Iterator[Tuple[int, str]]:
+        """
+        Yield every pattern's matches in a lowercased text.
+
+        Args:
+            text_lower: Lowercased text to scan
+
+        Returns:
+            Iterator of (pattern index, findall result) pairs
+        """
+        for index, pattern in enumerate(self.patterns):
+            for found in pattern.findall(text_lower):
+                yield index, found
@@ -7,6 +7,19 @@ from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Flags every content check runs with
+_PATTERN_FLAGS = re.IGNORECASE | re.MULTILINE
+
+_SCRIPT_TAG_RE = re.compile(r'<script[^>]*>.*?</script>', re.IGNORECASE | re.DOTALL)
+_JAVASCRIPT_URI_RE = re.compile(r'javascript:', re.IGNORECASE)
+_DATA_URI_RE = re.compile(r'data:', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def _compile_all(patterns: List[str]) -> Tuple["re.Pattern[str]", ...]:
+    """Compile a family of content-check patterns once."""
+    return tuple(re.compile(pattern, _PATTERN_FLAGS) for pattern in patterns)
+
 
 @dataclass
 class ValidationResult:
@@ -69,6 +82,12 @@ class SecurityGuardrails:
             r"test\s*[@\.]",
             r"(?:123|456|999)[\-\s]*(?:123|456|999)",  # Fake phone numbers
         ]
+        
+        # Compiled once per validator rather than looked up on every check
+        self._injection_res = _compile_all(self.injection_patterns)
+        self._cv_res = _compile_all(self.cv_patterns)
+        self._job_res = _compile_all(self.job_patterns)
+        self._suspicious_res = _compile_all(self.suspicious_patterns)
 
     def validate_resume(self, text: str) -> ValidationResult:
         """Validate that the input is a legitimate resume/CV."""
@@ -171,10 +190,10 @@ class SecurityGuardrails:
         text_lower = text.lower()
         matches = 0
         
-        for pattern in self.injection_patterns:
-            if re.search(pattern, text_lower, re.IGNORECASE | re.MULTILINE):
+        for pattern in self._injection_res:
+            if pattern.search(text_lower):
                 matches += 1
-                logger.warning(f"Potential injection pattern detected: {pattern}")
+                logger.warning("Potential injection pattern detected: %s", pattern.pattern)
         
         return min(matches / 3.0, 1.0)  # Normalize to 0-1
 
@@ -183,8 +202,8 @@ class SecurityGuardrails:
         matches = 0
         text_lower = text.lower()
         
-        for pattern in self.cv_patterns:
-            if re.search(pattern, text_lower, re.IGNORECASE | re.MULTILINE):
+        for pattern in self._cv_res:
+            if pattern.search(text_lower):
                 matches += 1
         
         return min(matches / len(self.cv_patterns), 1.0)
@@ -194,8 +213,8 @@ class SecurityGuardrails:
         matches = 0
         text_lower = text.lower()
         
-        for pattern in self.job_patterns:
-            if re.search(pattern, text_lower, re.IGNORECASE | re.MULTILINE):
+        for pattern in self._job_res:
+            if pattern.search(text_lower):
                 matches += 1
         
         return min(matches / len(self.job_patterns), 1.0)
@@ -205,8 +224,8 @@ class SecurityGuardrails:
         matches = 0
         text_lower = text.lower()
         
-        for pattern in self.suspicious_patterns:
-            if re.search(pattern, text_lower, re.IGNORECASE | re.MULTILINE):
+        for pattern in self._suspicious_res:
+            if pattern.search(text_lower):
                 matches += 1
         
         return min(matches / 2.0, 1.0)  # Normalize to 0-1
@@ -217,12 +236,12 @@ class SecurityGuardrails:
             return ""
         
         # Remove potential script tags and dangerous characters
-        text = re.sub(r'<script[^>]*>.*?</script>', '', text, flags=re.IGNORECASE | re.DOTALL)
-        text = re.sub(r'javascript:', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'data:', '', text, flags=re.IGNORECASE)
+        text = _SCRIPT_TAG_RE.sub('', text)
+        text = _JAVASCRIPT_URI_RE.sub('', text)
+        text = _DATA_URI_RE.sub('', text)
         
         # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RE.sub(' ', text)
         
         # Limit length
         if len(text) > 50000:  # 50KB limit
@@ -245,21 +264,46 @@ class ContentValidator:
         Returns:
             Tuple of (is_valid, error_message)
         """
+        is_valid, error_message = self.validate_resume_input(resume_text)
+        if not is_valid:
+            return False, error_message
         
-        # Sanitize inputs
-        resume_text = self.guardrails.sanitize_input(resume_text)
-        job_text = self.guardrails.sanitize_input(job_text)
+        return self.validate_job_input(job_text)
+
+    def validate_resume_input(self, resume_text: str) -> Tuple[bool, str]:
+        """
+        Validate the resume input on its own.
         
-        # Validate resume
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        resume_text = self.guardrails.sanitize_input(resume_text)
         resume_result = self.guardrails.validate_resume(resume_text)
         if not resume_result.is_valid:
             return False, f"Resume validation failed: {resume_result.error_message}"
         
-        # Validate job description
+        logger.info(
+            "Resume validation passed - confidence: %.1f%%", resume_result.confidence_score
+        )
+        return True, ""
+
+    def validate_job_input(self, job_text: str) -> Tuple[bool, str]:
+        """
+        Validate the job description input on its own.
+        
+        It needs no parsing, so it can reject a bad job description before the
+        resume is read.
+        
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        job_text = self.guardrails.sanitize_input(job_text)
         job_result = self.guardrails.validate_job_description(job_text)
         if not job_result.is_valid:
             return False, f"Job description validation failed: {job_result.error_message}"
         
-        logger.info(f"Validation passed - Resume confidence: {resume_result.confidence_score:.1f}%, Job confidence: {job_result.confidence_score:.1f}%")
-        
-        return True, ""
\ No newline at end of file
+        logger.info(
+            "Job description validation passed - confidence: %.1f%%",
+            job_result.confidence_score,
+        )
+        return True, ""
@@ -1,7 +1,10 @@
 """Tests for analyzer modules."""
 
+import pickle
+import sys
 import pytest
 from unittest.mock import Mock, patch
+from src.analyzer import resume_analyzer
 from src.analyzer.resume_analyzer import ResumeAnalyzer, ResumeData
 from src.analyzer.job_analyzer import JobAnalyzer, JobRequirements
 from src.analyzer.scorer import CompatibilityScorer
@@ -17,8 +20,8 @@ class TestResumeAnalyzer:
 
     def test_init(self) -> None:
         """Test analyzer initialization."""
-        assert isinstance(self.analyzer.phd_keywords, list)
-        assert isinstance(self.analyzer.academic_keywords, list)
+        assert isinstance(self.analyzer.phd_keywords, frozenset)
+        assert isinstance(self.analyzer.academic_keywords, frozenset)
         assert "phd" in self.analyzer.phd_keywords
         assert "university" in self.analyzer.academic_keywords
 
@@ -91,6 +94,11 @@ class TestResumeAnalyzer:
         assert contact["phone"] is not None
         assert contact["location"] is not None
 
+    def test_contact_email_rejects_pipe(self) -> None:
+        """Test that a pipe is not accepted in the email top-level domain."""
+        contact = self.analyzer._extract_contact_info("mail: jane@site.c|m")
+        assert contact["email"] is None
+
     def test_skills_extraction(self) -> None:
         """Test skills extraction."""
         text = "Experience with Python, machine learning, SQL, and project management"
@@ -100,6 +108,175 @@ class TestResumeAnalyzer:
         for expected in expected_skills:
             assert any(expected.lower() in skill.lower() for skill in skills)
 
+    def test_detect_academic_background_reuses_phd(self) -> None:
+        """Test that a known PhD result is not detected again."""
+        with patch.object(self.analyzer, "_detect_phd") as detect_phd:
+            assert self.analyzer._detect_academic_background(
+                "industry role", has_phd=True
+            ) is True
+            assert self.analyzer._detect_academic_background(
+                "university lab", has_phd=False
+            ) is True
+        
+        detect_phd.assert_not_called()
+
+    def test_analyze_cached(self) -> None:
+        """Test that repeated resumes reuse the cached analysis."""
+        text = "PhD in Physics, Python developer"
+        
+        with patch.object(
+            self.analyzer, "_extract_skills", wraps=self.analyzer._extract_skills
+        ) as extract_skills:
+            first = self.analyzer.analyze(text)
+            second = self.analyzer.analyze(text)
+        
+        assert first is second
+        assert extract_skills.call_count == 1
+        with pytest.raises(AttributeError):
+            first.has_phd = False
+
+    def test_analyze_batch(self) -> None:
+        """Test batch analysis serially and across worker processes."""
+        texts = [
+            "PhD in Physics, Python and SQL, Paris",
+            "Java developer\nBachelor in Computer Science",
+            "",
+        ]
+        
+        expected = [self.analyzer.analyze(text) for text in texts]
+        assert self.analyzer.analyze_batch(texts) == expected
+        assert self.analyzer.analyze_batch(texts, workers=2) == expected
+
+    def test_analyzer_picklable(self) -> None:
+        """Test that the analyzer pickles without its cache."""
+        self.analyzer.analyze("Python developer")
+        restored = pickle.loads(pickle.dumps(self.analyzer))
+        
+        assert restored.analyze("Python developer").skills == ["Python"]
+
+    def test_extract_publications_prescreen(self) -> None:
+        """Test that publication regexes only run when a keyword is present."""
+        text = 'Published in journal "Deep Nets for Cats" 2021'
+        assert self.analyzer._extract_publications(text) == [
+            'Published in journal "Deep Nets for Cats"'
+        ]
+        
+        with patch.object(resume_analyzer._PUB_PATTERNS, "finditer") as finditer:
+            assert self.analyzer._extract_publications("Python developer") == []
+        finditer.assert_not_called()
+
+    def test_extract_experience_limit(self) -> None:
+        """Test that experience stops at five entries and keeps original case."""
+        text = "\n".join(f"Senior Engineer at Company {i}" for i in range(8))
+        experience = self.analyzer._extract_experience(text)
+        
+        assert len(experience) == 5
+        assert experience[0] == {
+            "title": "Senior Engineer at Company 0",
+            "type": "work_experience",
+        }
+
+    def test_extract_education_per_line(self) -> None:
+        """Test that each degree line is extracted with its field."""
+        text = "PhD in Physics\nMSc in Data Science\nExperienced with databases"
+        education = self.analyzer._extract_education(text)
+        
+        assert [(edu["degree"], edu["field"]) for edu in education] == [
+            ("PhD", "Physics"),
+            ("MSc", "Data Science"),
+        ]
+
+    def test_extract_education_dotted_sc(self) -> None:
+        """Test that European M.Sc. and B.Sc. degrees are extracted."""
+        text = "M.Sc. in Physics, Université de Lyon\nB.Sc. Mathematics"
+        education = self.analyzer._extract_education(text)
+        
+        assert [(edu["degree"], edu["field"]) for edu in education] == [
+            ("M.Sc", "Physics"),
+            ("B.Sc", "Mathematics"),
+        ]
+
+    def test_analyze_scans_keywords_once(self) -> None:
+        """Test that all keyword sets are found in a single scan."""
+        text = "PhD in Physics, University lab in Paris. Python, French, PMP"
+        
+        with patch.object(
+            self.analyzer._keyword_groups,
+            "find",
+            wraps=self.analyzer._keyword_groups.find,
+        ) as find:
+            result = self.analyzer.analyze(text)
+        
+        assert find.call_count == 1
+        assert result.skills == ["Python"]
+        assert result.languages == ["French"]
+        assert result.certifications == ["Pmp"]
+        assert result.contact_info["location"] == "Paris"
+        assert result.has_phd is True
+        assert result.academic_background is True
+
+    def test_skills_canonical_names_shared(self) -> None:
+        """Test that the same skill from two resumes is one shared string."""
+        first = self.analyzer._extract_skills("Senior Python developer")
+        second = self.analyzer._extract_skills("python, sql")
+        
+        assert first == ["Python"]
+        assert first[0] is second[0]
+
+    def test_skills_extraction_whole_words(self) -> None:
+        """Test that skills are not picked up inside other words."""
+        skills = self.analyzer._extract_skills("Digital marketing, excellent JavaScript")
+        assert skills == ["Javascript"]
+
+    def test_skills_extraction_version_suffix(self) -> None:
+        """Test that skills followed by a version number are still found."""
+        skills = self.analyzer._extract_skills("Frontend: HTML5, CSS3, Java8, Python3")
+        assert sorted(skills) == ["Css", "Html", "Java", "Python"]
+
+    def test_skills_lower_interned(self) -> None:
+        """Test that lowercased skills are derived once and interned."""
+        resume_data = ResumeData(
+            contact_info={},
+            education=[],
+            experience=[],
+            skills=["Python", "Machine Learning"],
+            languages=[],
+            publications=[],
+            certifications=[],
+            has_phd=False,
+            academic_background=False
+        )
+        
+        assert resume_data.skills_lower == ["python", "machine learning"]
+        assert resume_data.skills_lower[1] is sys.intern("machine learning")
+
+    def test_resume_data_slotted_and_picklable(self) -> None:
+        """Test that resume data is slotted and survives pickling."""
+        result = self.analyzer.analyze("Python developer in Paris, PhD")
+        
+        assert not hasattr(result, "__dict__")
+        restored = pickle.loads(pickle.dumps(result))
+        assert restored == result
+        assert restored.skills_lower == result.skills_lower
+        assert restored.location_lower == "paris"
+
+    def test_lowercase_fields_derived(self) -> None:
+        """Test that languages and location are lowercased at construction."""
+        resume_data = ResumeData(
+            contact_info={"location": "Paris"},
+            education=[],
+            experience=[],
+            skills=[],
+            languages=["French", "English"],
+            publications=[],
+            certifications=[],
+            has_phd=False,
+            academic_background=False
+        )
+        
+        assert resume_data.languages_lower == ["french", "english"]
+        assert resume_data.location_lower == "paris"
+
 
 class TestJobAnalyzer:
     """Test cases for JobAnalyzer."""
@@ -129,6 +306,46 @@ class TestJobAnalyzer:
         assert len(result.required_skills) > 0
         assert result.location is not None
 
+    def test_analyze_cached(self) -> None:
+        """Test that repeated descriptions reuse the cached analysis."""
+        job_desc = "Senior Python engineer in Paris"
+        
+        with patch.object(
+            self.analyzer, "_extract_skills", wraps=self.analyzer._extract_skills
+        ) as extract_skills:
+            first = self.analyzer.analyze(job_desc)
+            second = self.analyzer.analyze(job_desc)
+        
+        assert first is second
+        assert extract_skills.call_count == 1
+
+    def test_job_requirements_frozen_and_picklable(self) -> None:
+        """Test that job requirements are immutable, slotted and picklable."""
+        result = self.analyzer.analyze("Senior Python engineer in Paris")
+        
+        with pytest.raises(AttributeError):
+            result.title = "Other"
+        assert not hasattr(result, "__dict__")
+        assert pickle.loads(pickle.dumps(result)) == result
+
+    def test_analyze_batch(self) -> None:
+        """Test batch analysis serially and across worker processes."""
+        job_descs = [
+            "Senior Python engineer in Lyon",
+            "Junior Java developer, required: Java, SQL",
+            "",
+        ]
+        
+        expected = [self.analyzer.analyze(desc) for desc in job_descs]
+        assert self.analyzer.analyze_batch(job_descs) == expected
+        assert self.analyzer.analyze_batch(job_descs, workers=2) == expected
+
+    def test_extract_job_title_first_line(self) -> None:
+        """Test the first-line fallback for the job title."""
+        text = "Data Engineers Wanted\nJoin our growing team."
+        assert self.analyzer._extract_job_title(text) == "Data Engineers Wanted"
+        assert self.analyzer._extract_job_title("Join us\nEngineer") == "Position"
+
     def test_extract_experience_requirements(self) -> None:
         """Test experience requirement extraction."""
         texts = [
@@ -151,6 +368,24 @@ class TestJobAnalyzer:
         assert self.analyzer._determine_job_level(junior_text) == "junior"
         assert self.analyzer._determine_job_level(mid_text) == "mid"
 
+    def test_determine_job_level_whole_words(self) -> None:
+        """Test that level keywords only match whole words."""
+        text = "Junior analyst, leadership training included"
+        assert self.analyzer._determine_job_level(text) == "junior"
+
+    def test_extract_industry_priority(self) -> None:
+        """Test industry detection order and hyphenated entries."""
+        assert self.analyzer._extract_industry("A fintech scale-up") == "Fintech"
+        assert self.analyzer._extract_industry("Retail and e-commerce") == "E-Commerce"
+        assert self.analyzer._extract_industry("No sector given") is None
+
+    def test_plural_level_and_industry_keywords(self) -> None:
+        """Test that plural forms still select the job level and industry."""
+        assert self.analyzer._determine_job_level("Seniors welcome") == "senior"
+        assert self.analyzer._determine_job_level("Open to juniors") == "junior"
+        assert self.analyzer._extract_industry("We build technologies for banks") == "Tech"
+        assert self.analyzer._extract_industry("Data for retailers") == "Retail"
+
     def test_extract_skills(self) -> None:
         """Test skills extraction from job description."""
         job_text = """
@@ -162,6 +397,28 @@ class TestJobAnalyzer:
         required, preferred = self.analyzer._extract_skills(job_text)
         assert len(required) > 0 or len(preferred) > 0
 
+    def test_extract_skills_deterministic_order(self) -> None:
+        """Test that extracted skills keep a stable, duplicate-free order."""
+        job_text = "Required: Python, SQL and Docker. Must have: Python and AWS."
+        
+        required, preferred = self.analyzer._extract_skills(job_text)
+        assert required == ["python", "sql", "docker", "aws"]
+        assert preferred == []
+
+    def test_extract_skills_version_suffix(self) -> None:
+        """Test that required skills followed by a version number are found."""
+        required, _ = self.analyzer._extract_skills("Required: Python3, SQL")
+        assert sorted(required) == ["python", "sql"]
+
+    def test_extract_keywords(self) -> None:
+        """Test keyword extraction by frequency."""
+        job_text = "Python python PYTHON data data with the cloud and team"
+        
+        keywords = self.analyzer._extract_keywords(job_text)
+        assert keywords[:2] == ["python", "data"]
+        assert "with" not in keywords
+        assert len(keywords) <= 20
+
 
 class TestCompatibilityScorer:
     """Test cases for CompatibilityScorer."""
@@ -275,6 +532,134 @@ class TestCompatibilityScorer:
         score = self.scorer._calculate_skills_match(resume_data, job_requirements)
         assert score > 80  # Should have high match
 
+    def test_breakdown_matches_methods(self) -> None:
+        """Test that the breakdown reports the per-criterion method scores."""
+        resume_data = ResumeData(
+            contact_info={"location": "Lyon"},
+            education=[{"degree": "Bachelor", "field": "Physics"}],
+            experience=[{"title": "Data Analyst"}] * 4,
+            skills=["Python"],
+            languages=["French"],
+            publications=[],
+            certifications=[],
+            has_phd=True,
+            academic_background=True
+        )
+        job_requirements = JobRequirements(
+            title="Junior Analyst",
+            company=None,
+            required_skills=["Python", "SQL"],
+            preferred_skills=[],
+            required_experience=None,
+            education_requirements=["Master"],
+            languages=["French", "English"],
+            location="Paris",
+            industry="Finance",
+            company_size=None,
+            job_level="junior",
+            keywords=[]
+        )
+        
+        score, breakdown = self.scorer.calculate_score(resume_data, job_requirements)
+        
+        for name, method in [
+            ("skills_match", self.scorer._calculate_skills_match),
+            ("experience_match", self.scorer._calculate_experience_match),
+            ("education_match", self.scorer._calculate_education_match),
+            ("overqualification_penalty",
+             self.scorer._calculate_overqualification_penalty),
+            ("language_match", self.scorer._calculate_language_match),
+            ("location_match", self.scorer._calculate_location_match),
+        ]:
+            assert breakdown[name] == method(resume_data, job_requirements)
+        assert score == breakdown["final_score"]
+
+    def test_calculate_score_min_threshold(self) -> None:
+        """Test the early return when the threshold is out of reach."""
+        resume_data = ResumeData(
+            contact_info={},
+            education=[],
+            experience=[],
+            skills=["Excel"],
+            languages=[],
+            publications=[],
+            certifications=[],
+            has_phd=False,
+            academic_background=False
+        )
+        job_requirements = JobRequirements(
+            title="Developer",
+            company=None,
+            required_skills=["Python", "Java"],
+            preferred_skills=["Docker"],
+            required_experience=None,
+            education_requirements=[],
+            languages=[],
+            location=None,
+            industry=None,
+            company_size=None,
+            job_level="senior",
+            keywords=[]
+        )
+        
+        full_score, full_breakdown = self.scorer.calculate_score(
+            resume_data, job_requirements
+        )
+        score, breakdown = self.scorer.calculate_score(
+            resume_data, job_requirements, min_threshold=90
+        )
+        assert breakdown["below_threshold"] is True
+        assert full_score <= score < 90
+        assert breakdown["final_score"] == score
+        assert full_breakdown.keys() <= breakdown.keys()
+        
+        reachable = self.scorer.calculate_score(
+            resume_data, job_requirements, min_threshold=full_score
+        )
+        assert reachable == self.scorer.calculate_score(resume_data, job_requirements)
+
+    def test_calculate_scores_batch(self) -> None:
+        """Test that batch scores equal one-at-a-time scores."""
+        resume_data = ResumeData(
+            contact_info={"location": "Paris"},
+            education=[{"degree": "Master", "field": "Computer Science"}],
+            experience=[{"title": "Software Engineer"}] * 4,
+            skills=["Python", "SQL"],
+            languages=["English"],
+            publications=[],
+            certifications=[],
+            has_phd=True,
+            academic_background=True
+        )
+        jobs = [
+            JobRequirements(
+                title="Developer",
+                company=None,
+                required_skills=required,
+                preferred_skills=["Docker"],
+                required_experience=None,
+                education_requirements=education,
+                languages=languages,
+                location=location,
+                industry=industry,
+                company_size=None,
+                job_level=level,
+                keywords=[]
+            )
+            for required, education, languages, location, industry, level in [
+                (["Python", "SQL"], ["Master"], ["English"], "Paris", None, "senior"),
+                (["Java"], ["PhD"], ["French"], "Lyon", "Finance", "junior"),
+                ([], [], [], None, "Technology", "mid"),
+            ]
+        ]
+        
+        expected = [self.scorer.calculate_score(resume_data, job)[0] for job in jobs]
+        assert self.scorer.calculate_scores_batch(resume_data, jobs) == expected
+        assert self.scorer.calculate_scores_batch(resume_data, []) == []
+        
+        with patch("src.analyzer.scorer._HAS_NUMPY", False):
+            assert self.scorer.calculate_scores_batch(resume_data, jobs) == expected
+
 
 class TestGapAnalyzer:
     """Test cases for GapAnalyzer."""
@@ -389,4 +774,76 @@ class TestGapAnalyzer:
         
         matching = self.analyzer._find_matching_skills(resume_data, job_requirements)
         assert len(matching) > 0
-        assert any("python" in skill.lower() for skill in matching)
\ No newline at end of file
+        assert any("python" in skill.lower() for skill in matching)
+
+    def test_find_matching_skills_containment(self) -> None:
+        """Test matching skills contained in either direction."""
+        resume_data = ResumeData(
+            contact_info={},
+            education=[],
+            experience=[],
+            skills=["JavaScript", "SQL"],
+            languages=[],
+            publications=[],
+            certifications=[],
+            has_phd=False,
+            academic_background=False
+        )
+        
+        job_requirements = JobRequirements(
+            title="Developer",
+            company=None,
+            required_skills=["Java", "PostgreSQL", "Go"],
+            preferred_skills=[],
+            required_experience=None,
+            education_requirements=[],
+            languages=[],
+            location=None,
+            industry=None,
+            company_size=None,
+            job_level="mid",
+            keywords=[]
+        )
+        
+        matching = self.analyzer._find_matching_skills(resume_data, job_requirements)
+        assert matching == ["Java", "Postgresql"]
+
+    def test_generic_points_are_copies(self) -> None:
+        """Test that mutating returned points does not alter the templates."""
+        resume_data = ResumeData(
+            contact_info={},
+            education=[],
+            experience=[],
+            skills=[],
+            languages=[],
+            publications=[],
+            certifications=[],
+            has_phd=True,
+            academic_background=False
+        )
+        
+        job_requirements = JobRequirements(
+            title="Developer",
+            company=None,
+            required_skills=[],
+            preferred_skills=[],
+            required_experience=None,
+            education_requirements=[],
+            languages=[],
+            location=None,
+            industry=None,
+            company_size=None,
+            job_level="mid",
+            keywords=[]
+        )
+        
+        weak = self.analyzer._generate_generic_weak_points(resume_data, job_requirements)
+        strong = self.analyzer._generate_generic_strong_points(resume_data)
+        weak[0]["point"] = "changed"
+        strong[0]["point"] = "changed"
+        
+        assert len(weak) == 3
+        assert self.analyzer._generate_generic_weak_points(
+            resume_data, job_requirements
+        )[0]["point"] != "changed"
+        assert self.analyzer._generate_generic_strong_points(resume_data)[0]["point"] != "changed"
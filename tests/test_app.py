@@ -0,0 +1,136 @@
+"""Tests for the Gradio application logic."""
+
+import os
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+from docx import Document
+from src.app import CVCheckApp, _PARSER_ATTRS
+
+SAMPLE_DATA = Path(__file__).parent / "sample_data"
+
+
+class TestCVCheckApp:
+    """Test cases for CVCheckApp."""
+
+    @pytest.fixture(autouse=True)
+    def setup_app(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Set up an app writing its reports in a temporary directory."""
+        monkeypatch.chdir(tmp_path)
+        with patch.object(CVCheckApp, "_initialize_openai_client", return_value=None):
+            self.app = CVCheckApp()
+
+        resume_text = (SAMPLE_DATA / "sample_resume.txt").read_text(encoding="utf-8")
+        resume_text = resume_text.replace("John Doe", "Camille Martin")
+        resume_text = resume_text.replace("john.doe", "camille.martin")
+        document = Document()
+        for line in resume_text.splitlines():
+            document.add_paragraph(line)
+        self.resume_file = str(tmp_path / "resume.docx")
+        document.save(self.resume_file)
+
+        self.job_description = (SAMPLE_DATA / "sample_job_description.txt").read_text(
+            encoding="utf-8"
+        )
+
+    def test_parsers_built_on_first_use(self) -> None:
+        """Test parsers are only created when a matching upload arrives."""
+        for parser_attr in set(_PARSER_ATTRS.values()):
+            assert parser_attr not in self.app.__dict__
+
+        assert self.app.parse_resume(self.resume_file) is not None
+        assert "docx_parser" in self.app.__dict__
+        assert "pdf_parser" not in self.app.__dict__
+
+    def test_parse_resume_unsupported_format(self, tmp_path: Path) -> None:
+        """Test extensions without a parser are rejected."""
+        text_file = tmp_path / "resume.txt"
+        text_file.write_text("Camille Martin", encoding="utf-8")
+        assert self.app.parse_resume(str(text_file)) is None
+
+    def test_parse_cache(self) -> None:
+        """Test an unchanged upload is parsed only once."""
+        with patch.object(
+            self.app.docx_parser, "parse", wraps=self.app.docx_parser.parse
+        ) as mock_parse:
+            first = self.app.parse_resume(self.resume_file)
+            second = self.app.parse_resume(self.resume_file)
+
+        assert first is not None
+        assert first == second
+        assert mock_parse.call_count == 1
+
+    def test_iter_analysis_streams_report_last(self) -> None:
+        """Test text results are shown before the report is generated."""
+        results = list(self.app.iter_analysis(self.resume_file, self.job_description))
+
+        assert len(results) == 2
+        assert results[0][4] is None
+        assert results[0][:4] == results[1][:4]
+        assert results[1][4] is not None
+        assert os.path.exists(results[1][4])
+
+    def test_invalid_job_description_rejected_before_parsing(self) -> None:
+        """Test a bad job description is reported without parsing the resume."""
+        with patch.object(self.app, "parse_resume") as mock_parse:
+            score, message, _, _, results_file = self.app.analyze_resume_job_match(
+                self.resume_file, "Too short"
+            )
+
+        assert score == 0
+        assert message.startswith("❌")
+        assert results_file is None
+        mock_parse.assert_not_called()
+
+    def test_missing_resume_reported_as_parse_failure(self, tmp_path: Path) -> None:
+        """Test an upload that cannot be read gets the parse failure message."""
+        score, message, _, _, results_file = self.app.analyze_resume_job_match(
+            str(tmp_path / "missing.docx"), self.job_description
+        )
+
+        assert score == 0
+        assert message.startswith("❌ Failed to parse resume")
+        assert results_file is None
+
+    def test_result_cache_hit(self) -> None:
+        """Test resubmitting the same inputs reuses the previous result."""
+        first = self.app.analyze_resume_job_match(self.resume_file, self.job_description)
+
+        with patch.object(self.app.resume_analyzer, "analyze") as mock_analyze:
+            second = self.app.analyze_resume_job_match(
+                self.resume_file, f"  {self.job_description}\n\n"
+            )
+
+        assert second == first
+        mock_analyze.assert_not_called()
+
+    def test_result_cache_invalidated_when_report_removed(self) -> None:
+        """Test a cached result is dropped once its report is deleted."""
+        first = self.app.analyze_resume_job_match(self.resume_file, self.job_description)
+        assert first[4] is not None
+        os.remove(first[4])
+
+        with patch.object(
+            self.app.resume_analyzer, "analyze", wraps=self.app.resume_analyzer.analyze
+        ) as mock_analyze:
+            second = self.app.analyze_resume_job_match(
+                self.resume_file, self.job_description
+            )
+
+        assert mock_analyze.call_count == 1
+        assert second[4] is not None
+        assert os.path.exists(second[4])
+
+    def test_failed_report_not_cached(self) -> None:
+        """Test a result without its report is analyzed again next time."""
+        with patch.object(
+            self.app, "_generate_complete_results_document", return_value=None
+        ):
+            first = self.app.analyze_resume_job_match(
+                self.resume_file, self.job_description
+            )
+        assert first[4] is None
+
+        second = self.app.analyze_resume_job_match(self.resume_file, self.job_description)
+        assert second[:4] == first[:4]
+        assert second[4] is not None
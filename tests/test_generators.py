@@ -1,5 +1,6 @@
 """Tests for generator modules."""
 
+import os
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
@@ -209,6 +210,52 @@ class TestWordDocumentGenerator:
             # Test that the method doesn't raise an exception
             self.generator._setup_document_styles(mock_doc)
 
+    def test_complete_analysis_document_reused_for_same_content(self, tmp_path: Path) -> None:
+        """Test identical report content maps to one file whatever its date."""
+        self.generator.output_dir = tmp_path
+        content = {"analysis_summary": {"score": 70, "analysis_date": "2024-01-01 10:00:00"}}
+        first = self.generator.generate_complete_analysis_document(content, "Engineer", "Tech Corp")
+        
+        content["analysis_summary"]["analysis_date"] = "2024-01-02 11:00:00"
+        second = self.generator.generate_complete_analysis_document(content, "Engineer", "Tech Corp")
+        assert first is not None
+        assert first == second
+        
+        content["analysis_summary"]["score"] = 80
+        third = self.generator.generate_complete_analysis_document(content, "Engineer", "Tech Corp")
+        assert third != first
+        assert len(list(tmp_path.glob("*.docx"))) == 2
+
+    def test_trim_output_dir_removes_oldest(self, tmp_path: Path) -> None:
+        """Test reports beyond the disk budget are removed oldest first."""
+        self.generator.output_dir = tmp_path
+        for age, name in enumerate(["newest", "middle", "oldest"]):
+            report = tmp_path / f"{name}.docx"
+            report.write_bytes(b"x" * 100)
+            os.utime(report, (1000 - age, 1000 - age))
+        
+        with patch('src.generator.word_generator._OUTPUT_DIR_BUDGET', 250):
+            self.generator._trim_output_dir()
+        
+        assert sorted(path.stem for path in tmp_path.glob("*.docx")) == ["middle", "newest"]
+
+    def test_complete_analysis_document_saved_atomically(self, tmp_path: Path) -> None:
+        """Test reports are renamed into place and trimmed only over budget."""
+        self.generator.output_dir = tmp_path
+        content = {"analysis_summary": {"score": 70}}
+        with patch.object(self.generator, '_trim_output_dir') as mock_trim:
+            result = self.generator.generate_complete_analysis_document(content, "Engineer")
+            mock_trim.assert_not_called()
+        
+        assert result is not None
+        assert [path.name for path in tmp_path.iterdir()] == [Path(result).name]
+        
+        content["analysis_summary"]["score"] = 80
+        with patch('src.generator.word_generator._OUTPUT_DIR_BUDGET', 0):
+            with patch.object(self.generator, '_trim_output_dir') as mock_trim:
+                self.generator.generate_complete_analysis_document(content, "Engineer")
+                mock_trim.assert_called_once()
+
 
 class TestInterviewPrepGenerator:
     """Test cases for InterviewPrepGenerator."""
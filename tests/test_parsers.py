@@ -69,6 +69,43 @@ class TestPDFParser:
         result = self.parser.parse("test.pdf")
         assert result is None
 
+    @patch('builtins.open', new_callable=mock_open, read_data=b'mock pdf data')
+    @patch('src.parsers.pdf_parser.pypdfium2')
+    @patch('pathlib.Path.exists', return_value=True)
+    def test_parse_with_pdfium(self, mock_exists: Mock, mock_pdfium: Mock, mock_file: Mock) -> None:
+        """Test PDFium extraction is preferred and its line endings normalized."""
+        mock_page = Mock()
+        mock_page.get_textpage.return_value.get_text_range.return_value = (
+            "Research Engi\ufffeneer\r\nPython"
+        )
+        mock_pdfium.PdfDocument.return_value.__iter__ = Mock(return_value=iter([mock_page]))
+
+        with patch('PyPDF2.PdfReader') as mock_reader:
+            result = self.parser.parse("test.pdf")
+            mock_reader.assert_not_called()
+
+        assert result == "Research Engineer\nPython"
+        mock_pdfium.PdfDocument.assert_called_once_with(b'mock pdf data')
+
+    @patch('builtins.open', new_callable=mock_open, read_data=b'mock pdf data')
+    @patch('src.parsers.pdf_parser.pypdfium2')
+    @patch('pathlib.Path.exists', return_value=True)
+    def test_parse_pdfium_page_error_falls_back(self, mock_exists: Mock, mock_pdfium: Mock, mock_file: Mock) -> None:
+        """Test a PDFium failure while reading pages falls back to PyPDF2."""
+        mock_page = Mock()
+        mock_page.get_textpage.side_effect = RuntimeError("bad page")
+        mock_document = mock_pdfium.PdfDocument.return_value
+        mock_document.__iter__ = Mock(return_value=iter([mock_page]))
+
+        with patch('PyPDF2.PdfReader') as mock_reader:
+            fallback_page = Mock()
+            fallback_page.extract_text.return_value = "Fallback text"
+            mock_reader.return_value.pages = [fallback_page]
+            result = self.parser.parse("test.pdf")
+
+        assert result == "Fallback text"
+        mock_document.close.assert_called_once()
+
     @patch('builtins.open', side_effect=Exception("File error"))
     @patch('pathlib.Path.exists', return_value=True)
     def test_parse_exception(self, mock_exists: Mock, mock_file: Mock) -> None:
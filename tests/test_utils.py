@@ -7,9 +7,13 @@ from src.utils.helpers import (
     extract_email, 
     extract_phone, 
     count_words, 
-    truncate_text
+    truncate_text,
+    file_fingerprint,
+    has_expected_signature
 )
-from src.utils.openai_client import OpenAIClient
+from src.utils.openai_client import OpenAIClient, get_openai_client
+from src.utils import text_search
+from src.utils.text_search import KeywordGroups, KeywordMatcher, PatternFamily
 
 
 class TestHelpers:
@@ -83,6 +87,30 @@ class TestHelpers:
         assert len(result) <= 20
         assert result.endswith("...")
 
+    def test_file_fingerprint(self, tmp_path) -> None:
+        """Test file digests follow the file content, not its name."""
+        first = tmp_path / "first.pdf"
+        second = tmp_path / "second.pdf"
+        first.write_bytes(b"resume content")
+        second.write_bytes(b"resume content")
+        assert file_fingerprint(str(first)) == file_fingerprint(str(second))
+        assert len(file_fingerprint(str(first))) == 16
+
+        second.write_bytes(b"edited resume content")
+        assert file_fingerprint(str(first)) != file_fingerprint(str(second))
+
+    def test_has_expected_signature(self, tmp_path) -> None:
+        """Test file content is checked against the format its extension names."""
+        pdf = tmp_path / "resume.pdf"
+        pdf.write_bytes(b"\n%PDF-1.7\n...")
+        docx = tmp_path / "resume.docx"
+        docx.write_bytes(b"PK\x03\x04...")
+        assert has_expected_signature(str(pdf), ".pdf") is True
+        assert has_expected_signature(str(docx), ".DOCX") is True
+        assert has_expected_signature(str(docx), ".pdf") is False
+        assert has_expected_signature(str(pdf), ".docx") is False
+        assert has_expected_signature(str(pdf), ".txt") is True
+
 
 class TestOpenAIClient:
     """Test cases for OpenAI client."""
@@ -106,6 +134,34 @@ class TestOpenAIClient:
             client = OpenAIClient()
             assert client.api_key == "env-key"
 
+    def test_max_concurrency_from_environment(self) -> None:
+        """Test that the request limit is read from the environment, with a fallback."""
+        with patch.dict('os.environ', {'OPENAI_MAX_CONCURRENCY': '2'}):
+            client = OpenAIClient(api_key="test-key")
+            assert client._request_slots.acquire(blocking=False)
+            assert client._request_slots.acquire(blocking=False)
+            assert not client._request_slots.acquire(blocking=False)
+        
+        with patch.dict('os.environ', {'OPENAI_MAX_CONCURRENCY': 'many'}):
+            client = OpenAIClient(api_key="test-key")
+            for _ in range(5):
+                assert client._request_slots.acquire(blocking=False)
+            assert not client._request_slots.acquire(blocking=False)
+
+    def test_get_openai_client_is_shared(self) -> None:
+        """Test that the process-wide client is created once."""
+        get_openai_client.cache_clear()
+        try:
+            with patch.dict('os.environ', {}, clear=True):
+                with pytest.raises(ValueError):
+                    get_openai_client()
+            with patch.dict('os.environ', {'OPENAI_API_KEY': 'env-key'}):
+                client = get_openai_client()
+                assert client.api_key == "env-key"
+                assert get_openai_client() is client
+        finally:
+            get_openai_client.cache_clear()
+
     @patch('src.utils.openai_client.OpenAI')
     def test_generate_completion_success(self, mock_openai: Mock) -> None:
         """Test successful completion generation."""
@@ -125,6 +181,38 @@ class TestOpenAIClient:
             assert result == "Generated response"
             mock_client.chat.completions.create.assert_called_once()
 
+    @patch('src.utils.openai_client.OpenAI')
+    def test_generate_completion_cached_on_disk(self, mock_openai: Mock, tmp_path) -> None:
+        """Test that a repeated request is answered from the completion cache."""
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = "Generated response"
+        
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = mock_response
+        mock_openai.return_value = mock_client
+        
+        client = OpenAIClient(api_key="test-key", cache_dir=str(tmp_path))
+        assert client.generate_completion("Test prompt") == "Generated response"
+        # A new client, as after a restart, reads the same entry
+        restarted = OpenAIClient(api_key="test-key", cache_dir=str(tmp_path))
+        assert restarted.generate_completion("Test prompt") == "Generated response"
+        mock_client.chat.completions.create.assert_called_once()
+        
+        # Any change to the request is a different entry
+        restarted.generate_completion("Test prompt", temperature=0.2)
+        assert mock_client.chat.completions.create.call_count == 2
+        assert not list(tmp_path.rglob("*.tmp"))
+
+    def test_failed_cache_write_leaves_no_temp_file(self, tmp_path) -> None:
+        """Test that a cache entry that cannot be stored is cleaned up."""
+        cache_path = tmp_path / "entry.json"
+        with patch('src.utils.openai_client.os.replace', side_effect=OSError("disk full")):
+            OpenAIClient._write_cached_completion(cache_path, "Generated response")
+
+        assert not cache_path.exists()
+        assert not list(tmp_path.rglob("*.tmp"))
+
     @patch('src.utils.openai_client.OpenAI')
     def test_generate_completion_failure(self, mock_openai: Mock) -> None:
         """Test completion generation failure."""
@@ -203,4 +291,183 @@ class TestOpenAIClient:
                 {"acceptance_score": 80}
             )
             
-            assert result == "Interview preparation content"
\ No newline at end of file
+            assert result == "Interview preparation content"
+
+    @patch('src.utils.openai_client.OpenAI')
+    def test_system_message_is_stable_prefix(self, mock_openai: Mock) -> None:
+        """Test the static system message leads every request unchanged."""
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = "Interview preparation content"
+        mock_response.usage.prompt_tokens = 1500
+        mock_response.usage.prompt_tokens_details.cached_tokens = 1024
+        
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = mock_response
+        mock_openai.return_value = mock_client
+        
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test-key'}):
+            client = OpenAIClient()
+            client.generate_interview_prep("First resume", "First job", {})
+            client.generate_interview_prep("Second resume", "Second job", {})
+            
+            first, second = (
+                call.kwargs["messages"]
+                for call in mock_client.chat.completions.create.call_args_list
+            )
+            assert first[0]["role"] == "system"
+            assert first[0] == second[0]
+            assert first[1] != second[1]
+
+
+class TestKeywordMatcher:
+    """Test cases for KeywordMatcher."""
+
+    def test_find_whole_words(self) -> None:
+        """Test that only whole-word keywords are reported."""
+        matcher = KeywordMatcher(["python", "java", "ai", "ci/cd"])
+        result = matcher.find("python and javascript, ci/cd pipelines to maintain")
+        assert result == ["python", "ci/cd"]
+
+    def test_find_version_suffix(self) -> None:
+        """Test that trailing digits end a whole word, on both backends."""
+        text = "html5, java8 and javascript, python3"
+        matcher = KeywordMatcher(["python", "java", "html"])
+        assert matcher.find(text) == ["python", "java", "html"]
+        with patch.object(text_search, "ahocorasick", None):
+            matcher = KeywordMatcher(["python", "java", "html"])
+            assert matcher.find(text) == ["python", "java", "html"]
+
+    def test_find_substrings(self) -> None:
+        """Test substring matching when word boundaries are disabled."""
+        matcher = KeywordMatcher(["python", "java"], whole_words=False)
+        assert matcher.find("javascript python") == ["python", "java"]
+
+    def test_finditer_whole_words_override(self) -> None:
+        """Test overriding the word boundary setting per scan, on both backends."""
+        text = "javascript, java"
+        for backend in (text_search.ahocorasick, None):
+            with patch.object(text_search, "ahocorasick", backend):
+                matcher = KeywordMatcher(["java", "javascript"], whole_words=False)
+                assert sorted(matcher.finditer(text)) == [
+                    (0, "java"), (0, "javascript"), (12, "java")
+                ]
+                assert sorted(matcher.finditer(text, whole_words=True)) == [
+                    (0, "javascript"), (12, "java")
+                ]
+                whole = KeywordMatcher(["java", "javascript"])
+                assert sorted(whole.finditer(text, whole_words=False)) == [
+                    (0, "java"), (0, "javascript"), (12, "java")
+                ]
+
+    def test_find_empty(self) -> None:
+        """Test empty vocabulary and empty text."""
+        assert KeywordMatcher([]).find("python") == []
+        assert KeywordMatcher(["python"]).find("") == []
+
+    def test_regex_fallback(self) -> None:
+        """Test the combined regex used without pyahocorasick."""
+        with patch.object(text_search, "ahocorasick", None):
+            matcher = KeywordMatcher(["machine learning", "sql", "nosql"])
+            assert matcher._automaton is None
+            result = matcher.find("nosql stores and machine learning")
+            assert result == ["machine learning", "nosql"]
+
+    def test_regex_fallback_shared_prefix(self) -> None:
+        """Test keywords starting at the same position without pyahocorasick."""
+        with patch.object(text_search, "ahocorasick", None):
+            matcher = KeywordMatcher(["lab", "laboratory"], whole_words=False)
+            assert matcher.find("research laboratory") == ["lab", "laboratory"]
+
+    def test_contains_any(self) -> None:
+        """Test the early-exit presence check."""
+        matcher = KeywordMatcher(["phd", "thesis"], whole_words=False)
+        assert matcher.contains_any("phd in physics") is True
+        assert matcher.contains_any("bachelor") is False
+        assert matcher.contains_any("") is False
+
+
+class TestKeywordGroups:
+    """Test cases for the combined multi-vocabulary matcher."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.groups = KeywordGroups(
+            {"skill": ["git", "agile"], "cert": ["agile", "certif"]},
+            whole_words=("skill",),
+        )
+
+    def test_find_buckets_by_category(self) -> None:
+        """Test that shared keywords land in every category they belong to."""
+        result = self.groups.find("certified agile coach, digital")
+        assert result == {"skill": ["agile"], "cert": ["agile", "certif"]}
+
+    def test_find_empty_text(self) -> None:
+        """Test that every category is present even without hits."""
+        assert self.groups.find("") == {"skill": [], "cert": []}
+
+    def test_regex_fallback_matches_automaton(self) -> None:
+        """Test that both backends bucket the same hits."""
+        text = "git and agile certification; legit"
+        expected = self.groups.find(text)
+        with patch.object(text_search, "ahocorasick", None):
+            groups = KeywordGroups(
+                {"skill": ["git", "agile"], "cert": ["agile", "certif"]},
+                whole_words=("skill",),
+            )
+            assert groups.find(text) == expected
+
+
+class TestPatternFamily:
+    """Test cases for PatternFamily."""
+
+    def test_search_priority_and_case(self) -> None:
+        """Test that the first pattern wins and original case is kept."""
+        family = PatternFamily(r'title:\s*([^\n]+)', r'looking for\s+([^\n]+)')
+        text = "We are looking for a Developer\nTitle: Data Engineer"
+        assert family.search(text, group=1) == "Data Engineer"
+        assert family.search("Looking for Testers", group=1) == "Testers"
+        assert family.search("Nothing here") is None
+
+    def test_search_length_changing_lowercase(self) -> None:
+        """Test the fallback when lowercasing changes the text length."""
+        family = PatternFamily(r'based in\s+(\w+)')
+        text = "İ Based in Lyon"
+        assert family.search(text, text.lower(), group=1) == "Lyon"
+
+    def test_search_without_re2(self) -> None:
+        """Test priority search with the standard library engine only."""
+        with patch.object(text_search, "re2", None):
+            family = PatternFamily(r'based in\s+([\w\s]+)')
+            assert family.search("Based in Île de France", group=1) == "Île de France"
+
+    def test_re2_syntax_translation(self) -> None:
+        """Test that Unicode classes are rewritten for RE2."""
+        assert text_search._to_re2_syntax(r'a[\w]*\w+\.') == r'a[\pL\pN_]*[\pL\pN_]+\.'
+        assert text_search._to_re2_syntax(r'\d\S') == r'[\p{Nd}][^\s\pZ\x0b\x1c-\x1f\x85]'
+
+    def test_re2_syntax_untranslatable(self) -> None:
+        """Test that escapes RE2 cannot match like re are left to re."""
+        assert text_search._to_re2_syntax(r'\bjava\b') is None
+        assert text_search._to_re2_syntax(r'[\S-]+') is None
+        assert text_search.compile_linear(r'\bjava\b').search("java") is not None
+
+    def test_unicode_spaces(self) -> None:
+        """Test that non-breaking spaces match \\s like they do in re."""
+        family = PatternFamily(r'poste[\s:]*([^\n]+)')
+        assert list(family.findall("poste\xa0: Data Scientist")) == [(0, "Data Scientist")]
+        assert list(family.findall("poste\u202f: Data Scientist")) == [(0, "Data Scientist")]
+
+    def test_findall(self) -> None:
+        """Test that matches are tagged with their pattern index."""
+        family = PatternFamily(r'required:\s*(\w+)', r'bonus:\s*(\w+)')
+        text = "required: python. bonus: docker. required: sql"
+        assert list(family.findall(text)) == [(0, "python"), (0, "sql"), (1, "docker")]
+
+    def test_finditer(self) -> None:
+        """Test that every match is yielded in priority order with its case."""
+        family = PatternFamily(r'journal\s+\w+', r'\d{4}')
+        text = "2020: Journal Nature, 2021: journal Science"
+        assert list(family.finditer(text)) == [
+            "Journal Nature", "journal Science", "2020", "2021"
+        ]